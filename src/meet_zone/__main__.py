@@ -34,8 +34,84 @@ def setup_debug_logging():
 		print(f"Failed to setup logging: {e}")
 		return False
 
+def run_subcommand(name: str, argv: List[str]) -> int:
+	"""Run a scripted subcommand's main(argv)
+
+	The imports are spelled out (not looked up by module name) so frozen
+	builds can see and bundle them.
+	"""
+	if name == "batch":
+		from meet_zone import batch
+		return batch.main(argv)
+	from meet_zone import server
+	return server.main(argv)
+
+SUBCOMMANDS = ("batch", "serve")
+
+def run_headless(args) -> int:
+	"""Search the roster and write ranked slots to stdout, without loading the UI"""
+	from meet_zone.export import ExportManager
+	from meet_zone.parser import RosterErrorReport, parse_roster
+	from meet_zone.scheduler import find_best_slots
+	from meet_zone.tracing import SearchStats
+	
+	if not args.roster_file:
+		print("Error: --headless needs a roster file", file=sys.stderr)
+		return 2
+	if args.trace:
+		logging.basicConfig(level=logging.DEBUG, format='%(asctime)s - %(levelname)s - %(message)s', stream=sys.stderr)
+	
+	try:
+		# Parser warnings must not end up in the output
+		report = RosterErrorReport()
+		try:
+			participants = parse_roster(args.roster_file, names=args.only, teams=args.team, report=report,
+				workers=args.parse_workers, cache=args.cache_roster)
+		finally:
+			if report.error_count:
+				print(report.summary(), file=sys.stderr)
+		stats = SearchStats() if args.stats else None
+		slots = find_best_slots(
+			participants=participants,
+			min_duration=args.duration,
+			show_week=args.week,
+			top_k=args.top,
+			start_date=args.date,
+			prioritize_participants=args.prioritize == 'participants',
+			horizon_days=args.horizon,
+			quorum=args.quorum,
+			tracer=make_tracer(args.trace),
+			stats=stats
+		)
+	except (OSError, ValueError, KeyError) as e:  # ZoneInfoNotFoundError is a KeyError
+		print(f"Error: {e}", file=sys.stderr)
+		return 1
+	
+	if args.format == 'csv':
+		ExportManager.write_results_csv(slots, sys.stdout)
+	elif args.format == 'json':
+		ExportManager.write_results_json(slots, participants, sys.stdout)
+		sys.stdout.write('\n')
+	elif args.format == 'ics':
+		ExportManager.write_calendar_ics(slots, sys.stdout)
+		sys.stdout.write('\n')
+	else:
+		ExportManager.write_results_table(slots, sys.stdout, len(participants))
+	
+	if stats is not None:
+		print(f"Search stats: {stats.summary()}", file=sys.stderr)
+	return 0
+
 def main() -> int:
 	"""Main entry point with comprehensive error handling"""
+	# Scripted runs skip the UI, its imports and the debug log entirely
+	if len(sys.argv) > 1 and sys.argv[1] in SUBCOMMANDS:
+		return run_subcommand(sys.argv[1], sys.argv[2:])
+	
+	args = parse_args()
+	if args.headless:
+		return run_headless(args)
+	
 	try:
 		# Setup debug logging first
 		setup_debug_logging()
@@ -48,49 +124,22 @@ def main() -> int:
 		logging.info(f"Frozen: {getattr(sys, 'frozen', False)}")
 		logging.info(f"Current working directory: {os.getcwd()}")
 		
-		# Test critical imports first
-		logging.info("Testing critical imports...")
-		
-		try:
-			import textual
-			logging.info(f"Textual version: {textual.__version__}")
-		except ImportError as e:
-			logging.error(f"Failed to import textual: {e}")
-			raise
-		
-		try:
-			from textual.app import App
-			from textual.widgets import TabbedContent, TabPane
-			logging.info("Textual widgets imported successfully")
-		except ImportError as e:
-			logging.error(f"Failed to import textual widgets: {e}")
-			raise
-		
-		try:
-			import pytz
-			logging.info(f"PyTZ imported successfully")
-		except ImportError as e:
-			logging.error(f"Failed to import pytz: {e}")
-			raise
-		
-		# Import application modules
+		# Import the search modules; the UI (textual) loads only once it is needed
 		logging.info("Importing application modules...")
 		try:
-			from meet_zone.parser import parse_roster, Participant
+			from meet_zone.parser import RosterErrorReport, parse_roster, Participant
 			from meet_zone.scheduler import find_best_slots, TimeSlot
-			from meet_zone.ui import display_results, MeetZoneApp
+			from meet_zone.tracing import SearchStats
 			logging.info("Application modules imported successfully")
 		except ImportError as e:
 			logging.error(f"Failed to import application modules: {e}")
 			raise
 		
-		# Parse command line arguments
-		logging.info("Parsing command line arguments...")
-		args = parse_args()
 		logging.info(f"Arguments parsed: {vars(args)}")
 		
 		participants: List[Participant] = []
 		best_slots: Optional[List[TimeSlot]] = None
+		stats: Optional[SearchStats] = None
 		
 		# Determine prioritization strategy
 		prioritize_participants = args.prioritize == 'participants'
@@ -99,18 +148,29 @@ def main() -> int:
 		if args.roster_file:
 			logging.info(f"Loading roster file: {args.roster_file}")
 			try:
-				participants = parse_roster(args.roster_file)
+				report = RosterErrorReport()
+				participants = parse_roster(args.roster_file, names=args.only, teams=args.team, report=report,
+					workers=args.parse_workers, cache=args.cache_roster)
 				logging.info(f"Loaded {len(participants)} participants")
+				if report.error_count:
+					logging.warning(f"Roster problems:\n{report.summary()}")
 				
+				stats = SearchStats() if args.stats else None
 				best_slots = find_best_slots(
 					participants=participants,
 					min_duration=args.duration,
 					show_week=args.week,
 					top_k=args.top,
 					start_date=args.date,
-					prioritize_participants=prioritize_participants
+					prioritize_participants=prioritize_participants,
+					horizon_days=args.horizon,
+					quorum=args.quorum,
+					tracer=make_tracer(args.trace),
+					stats=stats
 				)
 				logging.info(f"Found {len(best_slots) if best_slots else 0} meeting slots")
+				if stats is not None:
+					logging.info(f"Search stats: {stats.summary()}")
 			except Exception as e:
 				logging.error(f"Error processing roster file: {e}")
 				# Continue without roster data
@@ -118,13 +178,17 @@ def main() -> int:
 		# Launch the UI with or without initial data
 		logging.info("Launching UI...")
 		try:
+			from meet_zone.ui import display_results
+			logging.info(f"Textual version: {sys.modules['textual'].__version__}")
+			
 			app = display_results(
 				slots=best_slots,
 				participants=participants,
 				min_duration=args.duration,
 				show_week=args.week,
 				prioritize_participants=prioritize_participants,
-				start_date=args.date
+				start_date=args.date,
+				stats=stats
 			)
 			logging.info("UI created successfully")
 			
@@ -160,18 +224,49 @@ def main() -> int:
 		
 		return 1
 
+def make_tracer(verbosity):
+	"""Scheduler tracer for the --trace option (None keeps the search silent)"""
+	if verbosity is None:
+		return None
+	from meet_zone.tracing import TRACE_DETAIL, TRACE_SUMMARY, Tracer
+	return Tracer.to_logger(level=TRACE_DETAIL if verbosity == 'detail' else TRACE_SUMMARY)
+
 def parse_args():
 	parser = argparse.ArgumentParser(description="Find optimal meeting times across time zones")
 	parser.add_argument("roster_file", type=Path, nargs='?', help="Path to CSV roster file (optional)")
 	parser.add_argument("--duration", type=int, default=30, help="Minimum meeting duration in minutes")
 	parser.add_argument("--top", type=int, default=3, help="Number of top slots to display")
 	parser.add_argument("--week", action="store_true", help="Show full week instead of just today")
+	parser.add_argument("--horizon", type=int, metavar="DAYS",
+				   help="Search this many days from the start date (overrides --week)")
+	parser.add_argument("--only", action="append", metavar="NAME",
+				   help="Load only this participant from the roster (repeatable)")
+	parser.add_argument("--team", action="append",
+				   help="Load only rows of this team, from the roster's team column (repeatable)")
+	parser.add_argument("--parse-workers", type=int, default=1, metavar="N",
+				   help="Parse a large roster file on N processes (default: 1)")
+	parser.add_argument("--cache-roster", action="store_true",
+				   help="Load the roster from a binary cache file next to it, rebuilt when the CSV changes")
+	parser.add_argument("--quorum", type=int, metavar="N",
+				   help="Require everyone first, then fall back to slots with at least N participants")
 	parser.add_argument("--prioritize", choices=['participants', 'duration'], default='participants',
 				   help="Whether to prioritize maximizing participants or meeting duration")
 	parser.add_argument("--date", type=lambda s: datetime.strptime(s, '%Y-%m-%d').date(),
 				   help="Start date for search (format: YYYY-MM-DD, default: today)")
+	parser.add_argument("--trace", choices=['summary', 'detail'],
+				   help="Log scheduler trace events to the debug log at this verbosity")
+	parser.add_argument("--stats", action="store_true",
+				   help="Report per-phase timings and slot counts for the initial search")
+	parser.add_argument("--headless", action="store_true",
+				   help="Print the ranked slots to stdout instead of launching the UI")
+	parser.add_argument("--format", choices=['table', 'csv', 'json', 'ics'], default='table',
+				   help="Output format for --headless")
 	return parser.parse_args()
 
 
 if __name__ == "__main__":
+	# Frozen builds re-run this script in pool workers; let those exit here
+	if getattr(sys, 'frozen', False):
+		import multiprocessing
+		multiprocessing.freeze_support()
 	sys.exit(main())
@@ -0,0 +1,286 @@
+"""
+Interval arithmetic for participant availability
+"""
+
+from dataclasses import dataclass, field
+from datetime import date, time, timedelta
+from typing import Callable, Dict, Hashable, List, Optional, Tuple
+
+from meet_zone.parser import Participant
+from meet_zone.zones import MINUTES_PER_DAY, ZoneOffsetResolver, date_to_minutes, default_resolver
+
+# Half-open [start, end) range in minutes
+Interval = Tuple[int, int]
+
+
+def time_to_minutes(value: time) -> int:
+    """Minutes since midnight for a time of day"""
+    return value.hour * 60 + value.minute
+
+
+def merge_intervals(intervals: List[Interval]) -> List[Interval]:
+    """Sort intervals and merge any that overlap or touch"""
+    merged: List[Interval] = []
+    for start, end in sorted(intervals):
+        if end <= start:
+            continue
+        if merged and start <= merged[-1][1]:
+            if end > merged[-1][1]:
+                merged[-1] = (merged[-1][0], end)
+        else:
+            merged.append((start, end))
+    return merged
+
+
+def subtract_intervals(base: List[Interval], cuts: List[Interval]) -> List[Interval]:
+    """Remove every cut from the base intervals (both must be sorted and merged)"""
+    result: List[Interval] = []
+    j = 0
+    for start, end in base:
+        while j < len(cuts) and cuts[j][1] <= start:
+            j += 1
+        k = j
+        while k < len(cuts) and cuts[k][0] < end:
+            cut_start, cut_end = cuts[k]
+            if cut_start > start:
+                result.append((start, cut_start))
+            start = max(start, cut_end)
+            k += 1
+        if start < end:
+            result.append((start, end))
+    return result
+
+
+def get_working_intervals(participant: Participant) -> List[Interval]:
+    """Working hours for any local day, in minutes from local midnight"""
+    start = time_to_minutes(participant.start_time)
+    end = time_to_minutes(participant.end_time)
+    if end < start:
+        # Working hours span midnight (e.g., 22:00 to 06:00)
+        return merge_intervals([(0, end), (start, MINUTES_PER_DAY)])
+    return merge_intervals([(start, end)])
+
+
+def get_busy_intervals(participant: Participant, local_date: date) -> List[Interval]:
+    """Busy slots that apply to a local date, in minutes from local midnight"""
+    intervals = [
+        (time_to_minutes(slot.start_time), time_to_minutes(slot.end_time))
+        for slot in participant.get_busy_slots_for_date(local_date)
+    ]
+    return merge_intervals(intervals)
+
+
+def get_local_intervals(participant: Participant, local_date: date) -> List[Interval]:
+    """Working hours minus busy slots for one local date"""
+    return subtract_intervals(
+        get_working_intervals(participant),
+        get_busy_intervals(participant, local_date)
+    )
+
+
+def local_days_to_utc(tz_name: str, utc_date: date, local_intervals: Callable[[date], List[Interval]], resolver: ZoneOffsetResolver) -> List[Interval]:
+    """Convert per-local-day intervals to a UTC date, in minutes from UTC midnight
+
+    A UTC day overlaps the previous, same and next local day for any
+    real-world offset, so all three are converted and clipped. Wall times
+    skipped by a DST gap are dropped; repeated ones are kept at both instants.
+    """
+    day_start = date_to_minutes(utc_date)
+
+    intervals: List[Interval] = []
+    for day_delta in (-1, 0, 1):
+        local_date = utc_date + timedelta(days=day_delta)
+        local_midnight = date_to_minutes(local_date)
+        for start, end in local_intervals(local_date):
+            for utc_start, utc_end in resolver.local_range_to_utc(tz_name, local_midnight + start, local_midnight + end):
+                utc_start = max(utc_start - day_start, 0)
+                utc_end = min(utc_end - day_start, MINUTES_PER_DAY)
+                if utc_start < utc_end:
+                    intervals.append((utc_start, utc_end))
+    return merge_intervals(intervals)
+
+
+def get_utc_intervals(participant: Participant, utc_date: date, resolver: Optional[ZoneOffsetResolver] = None) -> List[Interval]:
+    """Available intervals for a UTC date, in minutes from UTC midnight"""
+    resolver = resolver or default_resolver(utc_date)
+    return local_days_to_utc(
+        participant.tz, utc_date,
+        lambda local_date: get_local_intervals(participant, local_date),
+        resolver
+    )
+
+
+class WeeklyAvailability:
+    """A participant's availability compiled into a 7-day local template
+
+    The template holds working hours minus daily and weekly busy slots for
+    each weekday. One-off dated slots are kept aside as sparse patches. On
+    a UTC date with a single offset and no patches nearby, the UTC
+    intervals are the template rotated by that offset, cached per
+    (weekday, offset). Other dates (DST transitions, patched days) take
+    the exact per-day path.
+    """
+
+    def __init__(self, participant: Participant):
+        self.tz = participant.tz
+        working = get_working_intervals(participant)
+        index = participant.get_busy_index()
+
+        def busy_ranges(slots) -> List[Interval]:
+            return [(time_to_minutes(slot.start_time), time_to_minutes(slot.end_time)) for _, slot in slots]
+
+        daily = busy_ranges(index.daily.slots)
+        self.week: List[List[Interval]] = []
+        for weekday in range(7):
+            weekly = index.weekly.get(weekday)
+            busy = daily + (busy_ranges(weekly.slots) if weekly else [])
+            self.week.append(subtract_intervals(working, merge_intervals(busy)))
+
+        self.patches: Dict[date, List[Interval]] = {
+            busy_date: merge_intervals(busy_ranges(bucket.slots))
+            for busy_date, bucket in index.dated.items()
+        }
+        self._rotated: Dict[Tuple[int, int], List[Interval]] = {}
+
+    def local_intervals(self, local_date: date) -> List[Interval]:
+        """Template for the weekday with any dated slots removed"""
+        intervals = self.week[local_date.weekday()]
+        patch = self.patches.get(local_date)
+        return subtract_intervals(intervals, patch) if patch else intervals
+
+    def get_utc_intervals(self, utc_date: date, resolver: ZoneOffsetResolver) -> List[Interval]:
+        """Available intervals for a UTC date, in minutes from UTC midnight"""
+        day_start = date_to_minutes(utc_date)
+        offset = resolver.fixed_offset(self.tz, day_start, day_start + MINUTES_PER_DAY)
+        patched = self.patches and any(
+            utc_date + timedelta(days=day_delta) in self.patches for day_delta in (-1, 0, 1)
+        )
+        if offset is None or patched:
+            return local_days_to_utc(self.tz, utc_date, self.local_intervals, resolver)
+
+        key = (utc_date.weekday(), offset)
+        rotated = self._rotated.get(key)
+        if rotated is None:
+            rotated = []
+            for day_delta in (-1, 0, 1):
+                shift = day_delta * MINUTES_PER_DAY - offset
+                for start, end in self.week[(utc_date.weekday() + day_delta) % 7]:
+                    start = max(start + shift, 0)
+                    end = min(end + shift, MINUTES_PER_DAY)
+                    if start < end:
+                        rotated.append((start, end))
+            rotated = self._rotated[key] = merge_intervals(rotated)
+        return rotated
+
+
+@dataclass
+class AvailabilityProfile:
+    """Names that share an identical availability fingerprint
+
+    participants holds the entries of one representative name (several when
+    a roster repeats a name); their availability is the profile's.
+    """
+    participants: List[Participant]
+    names: List[str] = field(default_factory=list)
+    _compiled: Optional[List[WeeklyAvailability]] = field(default=None, init=False, repr=False)
+
+    @property
+    def size(self) -> int:
+        return len(self.names)
+
+    def get_utc_intervals(self, utc_date: date, resolver: Optional[ZoneOffsetResolver] = None) -> List[Interval]:
+        """Available intervals for a UTC date (union over the representative entries)"""
+        resolver = resolver or default_resolver(utc_date)
+        if self._compiled is None:
+            self._compiled = [WeeklyAvailability(participant) for participant in self.participants]
+        if len(self._compiled) == 1:
+            return self._compiled[0].get_utc_intervals(utc_date, resolver)
+        intervals: List[Interval] = []
+        for compiled in self._compiled:
+            intervals.extend(compiled.get_utc_intervals(utc_date, resolver))
+        return merge_intervals(intervals)
+
+
+def get_availability_fingerprint(participant: Participant) -> Hashable:
+    """Everything about a participant that affects when they are available"""
+    busy = []
+    for slot in participant.busy_slots:
+        if slot.date is None:
+            applies_to = ("daily",)
+        elif slot.recurring:
+            applies_to = ("weekly", slot.date.weekday())
+        else:
+            applies_to = ("date", slot.date)
+        busy.append((time_to_minutes(slot.start_time), time_to_minutes(slot.end_time), applies_to))
+    return (
+        participant.tz,
+        time_to_minutes(participant.start_time),
+        time_to_minutes(participant.end_time),
+        tuple(sorted(busy))
+    )
+
+
+def get_roster_fingerprint(participants: List[Participant]) -> str:
+    """Stable hash of every name and availability fingerprint in a roster
+
+    Entry order does not matter, and the hash is the same across runs.
+    """
+    import hashlib
+
+    entries = sorted(repr((participant.name, get_availability_fingerprint(participant))) for participant in participants)
+    return hashlib.sha256("\n".join(entries).encode("utf-8")).hexdigest()
+
+
+def group_participants(participants: List[Participant], compiled: Optional[Callable[[Participant], WeeklyAvailability]] = None) -> List[AvailabilityProfile]:
+    """Collapse participants into availability equivalence classes
+
+    Entries are first gathered by name, since slots report names, and names
+    whose entries have the same fingerprints then share one profile. compiled
+    supplies already compiled availability (e.g., kept warm across searches).
+    """
+    by_name: Dict[str, List[Participant]] = {}
+    for participant in participants:
+        by_name.setdefault(participant.name, []).append(participant)
+
+    profiles: Dict[Hashable, AvailabilityProfile] = {}
+    for name, entries in by_name.items():
+        key = tuple(sorted(get_availability_fingerprint(entry) for entry in entries))
+        profile = profiles.get(key)
+        if profile is None:
+            profile = profiles[key] = AvailabilityProfile(participants=entries)
+        profile.names.append(name)
+
+    if compiled is not None:
+        for profile in profiles.values():
+            profile._compiled = [compiled(participant) for participant in profile.participants]
+    return list(profiles.values())
+
+
+def intervals_to_mask(intervals: List[Interval], interval_minutes: int = 15) -> int:
+    """Day bitmask where bit i is set if the instant i * interval_minutes is covered"""
+    num_slots = MINUTES_PER_DAY // interval_minutes
+    mask = 0
+    for start, end in intervals:
+        # First and one-past-last sample instants inside [start, end)
+        low = max(-(-start // interval_minutes), 0)
+        high = min(-(-end // interval_minutes), num_slots)
+        if high > low:
+            mask |= ((1 << (high - low)) - 1) << low
+    return mask
+
+
+def iter_mask_runs(mask: int):
+    """Yield (first_bit, end_bit) for each run of consecutive set bits"""
+    while mask:
+        lowest = mask & -mask
+        carried = mask + lowest
+        yield lowest.bit_length() - 1, (carried & ~mask).bit_length() - 1
+        mask &= carried
+
+
+def iter_mask_bits(mask: int):
+    """Yield the index of every set bit"""
+    while mask:
+        lowest = mask & -mask
+        yield lowest.bit_length() - 1
+        mask ^= lowest
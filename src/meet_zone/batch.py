@@ -0,0 +1,157 @@
+"""
+Batch mode: answer a file of JSON search requests against one roster
+
+Run with `meet-zone batch REQUESTS --roster ROSTER`. REQUESTS holds one JSON
+object per line (see session.parse_search_request for the fields), e.g.
+
+    {"id": "standup", "participants": ["Alice", "Bob"], "duration": 30, "top": 3}
+
+and one JSON reply per request is written in the same order, holding either
+"slots" or "error". The roster is parsed once and kept warm, per worker
+process when --workers is above 1.
+"""
+
+import argparse
+import json
+import sys
+from collections import deque
+from contextlib import redirect_stdout
+from pathlib import Path
+from typing import Any, Deque, Dict, Iterator, List, Optional, TextIO, Tuple
+
+from meet_zone.session import RosterSession
+
+# Session of each worker process, built once by _init_worker
+_worker_session: Optional[RosterSession] = None
+# Why the worker could not load the roster, raised again by its first request
+_worker_error: Optional[Exception] = None
+
+
+def read_requests(stream: TextIO) -> Iterator[Tuple[Optional[Dict[str, Any]], Dict[str, Any]]]:
+    """Yield (request, error reply) pairs per line; exactly one of the two is set
+
+    Blank lines and lines starting with '#' are skipped. Requests without an
+    id get their line number.
+    """
+    for line_number, line in enumerate(stream, 1):
+        line = line.strip()
+        if not line or line.startswith('#'):
+            continue
+        try:
+            request = json.loads(line)
+        except json.JSONDecodeError as e:
+            yield None, {"id": line_number, "error": f"Invalid JSON: {e}"}
+            continue
+        if not isinstance(request, dict):
+            yield None, {"id": line_number, "error": "Request must be a JSON object"}
+            continue
+        request.setdefault("id", line_number)
+        yield request, {}
+
+
+def load_session(roster_path: Path) -> RosterSession:
+    """Parse the roster with its warnings sent to stderr (stdout carries replies)"""
+    with redirect_stdout(sys.stderr):
+        return RosterSession.from_roster(roster_path)
+
+
+def _init_worker(roster_path: Path) -> None:
+    # An initializer that raises breaks the pool with a traceback, so the
+    # error is kept and surfaces in the parent from the first result instead
+    global _worker_session, _worker_error
+    try:
+        _worker_session = load_session(roster_path)
+    except (OSError, ValueError) as e:
+        _worker_error = e
+
+
+def _answer_in_worker(request: Dict[str, Any]) -> Dict[str, Any]:
+    if _worker_error is not None:
+        raise _worker_error
+    return _worker_session.answer(request)
+
+
+def write_reply(reply: Dict[str, Any], output: TextIO) -> None:
+    output.write(json.dumps(reply) + '\n')
+    output.flush()
+
+
+def run_serial(session: RosterSession, stream: TextIO, output: TextIO) -> int:
+    """Answer requests one by one in this process; returns the number of errors"""
+    errors = 0
+    for request, reply in read_requests(stream):
+        if request is not None:
+            reply = session.answer(request)
+        errors += "error" in reply
+        write_reply(reply, output)
+    return errors
+
+
+def run_parallel(roster_path: Path, workers: int, stream: TextIO, output: TextIO) -> int:
+    """Answer requests on a process pool, replying in input order
+
+    Each worker parses the roster once. At most two requests per worker are
+    in flight, so a long request file is streamed rather than read up front.
+    """
+    from concurrent.futures import ProcessPoolExecutor
+
+    errors = 0
+    pending: Deque = deque()
+
+    def flush(limit: int) -> None:
+        nonlocal errors
+        while len(pending) > limit:
+            item = pending.popleft()
+            reply = item if isinstance(item, dict) else item.result()
+            errors += "error" in reply
+            write_reply(reply, output)
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(roster_path,)) as executor:
+        for request, reply in read_requests(stream):
+            pending.append(executor.submit(_answer_in_worker, request) if request is not None else reply)
+            flush(2 * workers)
+        flush(0)
+    return errors
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="meet-zone batch",
+                                     description="Answer JSON search requests (one per line) against a roster")
+    parser.add_argument("requests", help="File of JSON requests, or - for stdin")
+    parser.add_argument("--roster", "-r", type=Path, required=True, help="Path to roster CSV file")
+    parser.add_argument("--workers", "-w", type=int, default=1, help="Worker processes (default: 1)")
+    parser.add_argument("--output", "-o", type=Path, help="Write replies to a file instead of stdout")
+    args = parser.parse_args(argv)
+
+    if not args.roster.is_file():
+        print(f"Error: roster file not found: {args.roster}", file=sys.stderr)
+        return 1
+
+    try:
+        stream = sys.stdin if args.requests == '-' else open(args.requests)
+        output = open(args.output, 'w') if args.output else sys.stdout
+    except OSError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+
+    try:
+        if args.workers > 1:
+            errors = run_parallel(args.roster, args.workers, stream, output)
+        else:
+            errors = run_serial(load_session(args.roster), stream, output)
+    except (OSError, ValueError) as e:
+        print(f"Error loading roster: {e}", file=sys.stderr)
+        return 1
+    finally:
+        if stream is not sys.stdin:
+            stream.close()
+        if output is not sys.stdout:
+            output.close()
+
+    if errors:
+        print(f"{errors} request(s) failed", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
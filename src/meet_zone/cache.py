@@ -0,0 +1,52 @@
+"""
+LRU memoization of candidate slots between searches
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Any, Hashable, Optional
+
+
+class SlotCache:
+    """Least-recently-used cache of a search's unranked candidate slots
+
+    find_best_slots keys entries by roster fingerprint, minimum duration,
+    date range, interval and engine, so a repeated search that only changes
+    top_k or the ranking priority re-ranks cached candidates instead of
+    recomputing availability. A roster change produces a new key; owners
+    that mutate their roster can also clear() to release stale entries.
+    Safe to share between threads.
+    """
+
+    def __init__(self, maxsize: int = 16):
+        if maxsize <= 0:
+            raise ValueError("maxsize must be positive")
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry
+
+    def put(self, key: Hashable, entry: Any) -> None:
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -44,14 +44,11 @@ class ConfigManager:
         self.load_config()
     
     def _get_config_dir(self) -> Path:
-        """Get the configuration directory"""
+        """Get the configuration directory (created on first save)"""
         if os.name == 'nt':  # Windows
-            config_dir = Path(os.environ.get('APPDATA', '')) / "MeetZone"
-        else:  # macOS/Linux
-            config_dir = Path.home() / ".config" / "meetzone"
-        
-        config_dir.mkdir(parents=True, exist_ok=True)
-        return config_dir
+            return Path(os.environ.get('APPDATA', '')) / "MeetZone"
+        # macOS/Linux
+        return Path.home() / ".config" / "meetzone"
     
     def load_config(self) -> None:
         """Load configuration from file"""
@@ -71,6 +68,7 @@ class ConfigManager:
     def save_config(self) -> None:
         """Save configuration to file"""
         try:
+            self.config_dir.mkdir(parents=True, exist_ok=True)
             with open(self.config_file, 'w') as f:
                 json.dump(asdict(self.config), f, indent=2)
         except Exception as e:
@@ -93,5 +91,20 @@ class ConfigManager:
         self.save_config()
 
 
-# Global config manager instance
-config_manager = ConfigManager()
+_config_manager: Optional[ConfigManager] = None
+
+
+def get_config_manager() -> ConfigManager:
+    """Global config manager, loaded from disk on first use"""
+    global _config_manager
+    if _config_manager is None:
+        _config_manager = ConfigManager()
+    return _config_manager
+
+
+def __getattr__(name: str) -> Any:
+    # Keep `from meet_zone.config import config_manager` working without
+    # reading the config file at import time
+    if name == "config_manager":
+        return get_config_manager()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -6,7 +6,7 @@ import csv
 import json
 from datetime import datetime
 from pathlib import Path
-from typing import List, Optional
+from typing import List, Optional, TextIO
 from dataclasses import asdict
 
 from meet_zone.parser import Participant
@@ -36,114 +36,152 @@ class ExportManager:
             print(f"Error exporting participants: {e}")
             return False
     
+    @staticmethod
+    def write_results_table(slots: List[TimeSlot], stream: TextIO, total_participants: int) -> None:
+        """Write meeting results as an aligned text table"""
+        rows = [("Start (UTC)", "End (UTC)", "Duration", "Count", "Score", "Names")]
+        for slot in slots:
+            rows.append((
+                slot.start_time.strftime('%Y-%m-%d %H:%M'),
+                slot.end_time.strftime('%Y-%m-%d %H:%M'),
+                f"{slot.get_duration_minutes()} min",
+                f"{slot.participant_count}/{total_participants}",
+                f"{int(slot.score * 100)}%",
+                ', '.join(sorted(slot.participant_names))
+            ))
+        
+        # Pad every column but the last (names)
+        widths = [max(len(row[i]) for row in rows) for i in range(len(rows[0]) - 1)]
+        for row in rows:
+            cells = [cell.ljust(width) for cell, width in zip(row, widths)]
+            stream.write('  '.join(cells + [row[-1]]) + '\n')
+    
+    @staticmethod
+    def write_results_csv(slots: List[TimeSlot], stream: TextIO) -> None:
+        """Write meeting results as CSV"""
+        writer = csv.writer(stream)
+        writer.writerow([
+            'start_time_utc', 'end_time_utc', 'duration_minutes',
+            'participant_count', 'score', 'participants'
+        ])
+        
+        for slot in slots:
+            writer.writerow([
+                slot.start_time.strftime('%Y-%m-%d %H:%M:%S'),
+                slot.end_time.strftime('%Y-%m-%d %H:%M:%S'),
+                slot.get_duration_minutes(),
+                slot.participant_count,
+                f"{slot.score:.3f}",
+                ', '.join(sorted(slot.participant_names))
+            ])
+    
     @staticmethod
     def export_results_csv(slots: List[TimeSlot], file_path: Path) -> bool:
         """Export meeting results to CSV file"""
         try:
             with open(file_path, 'w', newline='') as csvfile:
-                writer = csv.writer(csvfile)
-                writer.writerow([
-                    'start_time_utc', 'end_time_utc', 'duration_minutes',
-                    'participant_count', 'score', 'participants'
-                ])
-                
-                for slot in slots:
-                    writer.writerow([
-                        slot.start_time.strftime('%Y-%m-%d %H:%M:%S'),
-                        slot.end_time.strftime('%Y-%m-%d %H:%M:%S'),
-                        slot.get_duration_minutes(),
-                        slot.participant_count,
-                        f"{slot.score:.3f}",
-                        ', '.join(sorted(slot.participant_names))
-                    ])
+                ExportManager.write_results_csv(slots, csvfile)
             return True
         except Exception as e:
             print(f"Error exporting results: {e}")
             return False
     
     @staticmethod
-    def export_results_json(slots: List[TimeSlot], participants: List[Participant], 
+    def slot_to_dict(slot: TimeSlot) -> dict:
+        """JSON-ready fields of a meeting slot"""
+        return {
+            'start_time_utc': slot.start_time.isoformat(),
+            'end_time_utc': slot.end_time.isoformat(),
+            'duration_minutes': slot.get_duration_minutes(),
+            'participant_count': slot.participant_count,
+            'score': slot.score,
+            'participants': sorted(slot.participant_names),
+            'day_offset': getattr(slot, 'day_offset', 0)
+        }
+    
+    @staticmethod
+    def write_results_json(slots: List[TimeSlot], participants: List[Participant],
+                           stream: TextIO, metadata: Optional[dict] = None) -> None:
+        """Write complete results as JSON"""
+        data = {
+            'metadata': {
+                'export_time': datetime.now().isoformat(),
+                'total_participants': len(participants),
+                'total_slots': len(slots),
+                **(metadata or {})
+            },
+            'participants': [
+                {
+                    'name': p.name,
+                    'timezone': p.tz,
+                    'start_time': p.start_time.strftime('%H:%M'),
+                    'end_time': p.end_time.strftime('%H:%M')
+                }
+                for p in participants
+            ],
+            'meeting_slots': [ExportManager.slot_to_dict(slot) for slot in slots]
+        }
+        
+        json.dump(data, stream, indent=2)
+    
+    @staticmethod
+    def export_results_json(slots: List[TimeSlot], participants: List[Participant],
                            file_path: Path, metadata: Optional[dict] = None) -> bool:
         """Export complete results to JSON file"""
         try:
-            data = {
-                'metadata': {
-                    'export_time': datetime.now().isoformat(),
-                    'total_participants': len(participants),
-                    'total_slots': len(slots),
-                    **(metadata or {})
-                },
-                'participants': [
-                    {
-                        'name': p.name,
-                        'timezone': p.tz,
-                        'start_time': p.start_time.strftime('%H:%M'),
-                        'end_time': p.end_time.strftime('%H:%M')
-                    }
-                    for p in participants
-                ],
-                'meeting_slots': [
-                    {
-                        'start_time_utc': slot.start_time.isoformat(),
-                        'end_time_utc': slot.end_time.isoformat(),
-                        'duration_minutes': slot.get_duration_minutes(),
-                        'participant_count': slot.participant_count,
-                        'score': slot.score,
-                        'participants': list(slot.participant_names),
-                        'day_offset': getattr(slot, 'day_offset', 0)
-                    }
-                    for slot in slots
-                ]
-            }
-            
             with open(file_path, 'w') as f:
-                json.dump(data, f, indent=2)
+                ExportManager.write_results_json(slots, participants, f, metadata)
             return True
         except Exception as e:
             print(f"Error exporting JSON: {e}")
             return False
     
     @staticmethod
-    def export_calendar_ics(slots: List[TimeSlot], file_path: Path, 
-                           meeting_title: str = "Team Meeting") -> bool:
-        """Export meeting slots to ICS calendar format"""
-        try:
-            ics_content = [
-                "BEGIN:VCALENDAR",
-                "VERSION:2.0",
-                "PRODID:-//Meet-Zone//Meeting Scheduler//EN",
-                "CALSCALE:GREGORIAN",
-                "METHOD:PUBLISH"
-            ]
+    def write_calendar_ics(slots: List[TimeSlot], stream: TextIO,
+                           meeting_title: str = "Team Meeting") -> None:
+        """Write meeting slots in ICS calendar format"""
+        ics_content = [
+            "BEGIN:VCALENDAR",
+            "VERSION:2.0",
+            "PRODID:-//Meet-Zone//Meeting Scheduler//EN",
+            "CALSCALE:GREGORIAN",
+            "METHOD:PUBLISH"
+        ]
+        
+        for i, slot in enumerate(slots):
+            # Create unique UID
+            uid = f"meetzone-{slot.start_time.strftime('%Y%m%d%H%M%S')}-{i}"
             
-            for i, slot in enumerate(slots):
-                # Create unique UID
-                uid = f"meetzone-{slot.start_time.strftime('%Y%m%d%H%M%S')}-{i}"
-                
-                # Format times for ICS
-                start_time = slot.start_time.strftime('%Y%m%dT%H%M%SZ')
-                end_time = slot.end_time.strftime('%Y%m%dT%H%M%SZ')
-                
-                # Create description
-                description = f"Participants: {', '.join(sorted(slot.participant_names))}\\n"
-                description += f"Duration: {slot.get_duration_minutes()} minutes\\n"
-                description += f"Score: {slot.score:.1%}"
-                
-                ics_content.extend([
-                    "BEGIN:VEVENT",
-                    f"UID:{uid}",
-                    f"DTSTART:{start_time}",
-                    f"DTEND:{end_time}",
-                    f"SUMMARY:{meeting_title} (Option {i+1})",
-                    f"DESCRIPTION:{description}",
-                    f"STATUS:TENTATIVE",
-                    "END:VEVENT"
-                ])
+            # Format times for ICS
+            start_time = slot.start_time.strftime('%Y%m%dT%H%M%SZ')
+            end_time = slot.end_time.strftime('%Y%m%dT%H%M%SZ')
             
-            ics_content.append("END:VCALENDAR")
+            # Create description
+            description = f"Participants: {', '.join(sorted(slot.participant_names))}\\n"
+            description += f"Duration: {slot.get_duration_minutes()} minutes\\n"
+            description += f"Score: {slot.score:.1%}"
             
+            ics_content.extend([
+                "BEGIN:VEVENT",
+                f"UID:{uid}",
+                f"DTSTART:{start_time}",
+                f"DTEND:{end_time}",
+                f"SUMMARY:{meeting_title} (Option {i+1})",
+                f"DESCRIPTION:{description}",
+                f"STATUS:TENTATIVE",
+                "END:VEVENT"
+            ])
+        
+        ics_content.append("END:VCALENDAR")
+        stream.write('\n'.join(ics_content))
+    
+    @staticmethod
+    def export_calendar_ics(slots: List[TimeSlot], file_path: Path,
+                           meeting_title: str = "Team Meeting") -> bool:
+        """Export meeting slots to ICS calendar format"""
+        try:
             with open(file_path, 'w') as f:
-                f.write('\n'.join(ics_content))
+                ExportManager.write_calendar_ics(slots, f, meeting_title)
             return True
         except Exception as e:
             print(f"Error exporting calendar: {e}")
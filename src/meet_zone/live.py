@@ -0,0 +1,136 @@
+"""
+Live availability: per-date attendance kept current under roster edits
+"""
+
+from dataclasses import replace
+from datetime import date
+from typing import Dict, List, Optional, Set, Tuple
+
+from meet_zone.availability import MINUTES_PER_DAY, AvailabilityProfile, intervals_to_mask, iter_mask_runs
+from meet_zone.parser import Participant
+from meet_zone.scheduler import TimeSlot, TopSlotCollector, find_continuous_mask_slots, get_search_ladder, score_slot
+from meet_zone.zones import ZoneOffsetResolver
+
+
+class LiveAvailability:
+    """Per-slot attendee masks for a fixed set of dates, updated one name at a time
+
+    Each name owns one bit. For every date the model keeps that name's
+    day mask and, per slot of the UTC day, the mask of everyone available,
+    as in the bitset engine. set() recompiles only the edited name, flips
+    its bit in the slots where its availability changed, and drops the
+    candidate slots of just those dates; find_best_slots re-derives them
+    lazily and re-ranks from the per-date candidates it already has.
+    Results match scheduler.find_best_slots for the same dates.
+    """
+
+    def __init__(self, participants: List[Participant], dates: List[date], interval_minutes: int = 15,
+                 resolver: Optional[ZoneOffsetResolver] = None):
+        if not dates:
+            raise ValueError("LiveAvailability needs at least one date")
+        self.dates = list(dates)
+        self.interval_minutes = interval_minutes
+        self.resolver = resolver or ZoneOffsetResolver(self.dates[0], self.dates[-1])
+        self.resolver.prepare({participant.tz for participant in participants})
+
+        num_slots = MINUTES_PER_DAY // interval_minutes
+        self._slot_masks: List[List[int]] = [[0] * num_slots for _ in self.dates]
+        self._profiles: List[AvailabilityProfile] = []  # by bit; freed bits hold an empty profile
+        self._free_bits: List[int] = []
+        self._bits: Dict[str, int] = {}
+        self._day_masks: Dict[str, List[int]] = {}
+        self._entry_counts: Dict[str, int] = {}
+        # Candidate slots per date and (min_duration, min_attendees), built on demand
+        self._candidates: List[Dict[Tuple[int, int], List[TimeSlot]]] = [{} for _ in self.dates]
+
+        by_name: Dict[str, List[Participant]] = {}
+        for participant in participants:
+            by_name.setdefault(participant.name, []).append(participant)
+        for name, entries in by_name.items():
+            self.set(name, entries)
+
+    @property
+    def participant_count(self) -> int:
+        """Roster entries in the model (a name may have several)"""
+        return sum(self._entry_counts.values())
+
+    def set(self, name: str, entries: List[Participant]) -> Set[date]:
+        """Replace a name's roster entries (none removes the name); returns the dates that changed
+
+        Entries are compiled immediately, so later in-place edits to them
+        only take effect through another set().
+        """
+        if entries:
+            profile = AvailabilityProfile(participants=list(entries), names=[name])
+            new_masks = [
+                intervals_to_mask(profile.get_utc_intervals(day, self.resolver), self.interval_minutes)
+                for day in self.dates
+            ]
+        else:
+            profile = AvailabilityProfile(participants=[])
+            new_masks = [0] * len(self.dates)
+
+        bit = self._bits.get(name)
+        if bit is None:
+            if not entries:
+                return set()
+            bit = self._free_bits.pop() if self._free_bits else len(self._profiles)
+            if bit == len(self._profiles):
+                self._profiles.append(profile)
+            self._bits[name] = bit
+        self._profiles[bit] = profile
+
+        touched: Set[date] = set()
+        old_masks = self._day_masks.get(name, [0] * len(self.dates))
+        flag = 1 << bit
+        for index, (old_mask, new_mask) in enumerate(zip(old_masks, new_masks)):
+            if old_mask == new_mask:
+                continue
+            slot_masks = self._slot_masks[index]
+            for start, end in iter_mask_runs(old_mask ^ new_mask):
+                for slot in range(start, end):
+                    slot_masks[slot] ^= flag
+            self._candidates[index].clear()
+            touched.add(self.dates[index])
+
+        if entries:
+            self._day_masks[name] = new_masks
+            self._entry_counts[name] = len(entries)
+        else:
+            del self._bits[name], self._day_masks[name], self._entry_counts[name]
+            self._free_bits.append(bit)
+        return touched
+
+    def _slots(self, index: int, rung: Tuple[int, int]) -> List[TimeSlot]:
+        candidates = self._candidates[index]
+        slots = candidates.get(rung)
+        if slots is None:
+            min_duration, min_attendees = rung
+            slots = find_continuous_mask_slots(self._slot_masks[index], self._profiles, self.dates[index],
+                                               min_duration, self.interval_minutes, min_attendees)
+            for slot in slots:
+                slot.day_offset = index
+            candidates[rung] = slots
+        return slots
+
+    def find_best_slots(self, min_duration: int, top_k: int = 3, prioritize_participants: bool = True,
+                        quorum: Optional[int] = None) -> List[TimeSlot]:
+        """Best slots over the model's dates, with the same ladder and ranking as find_best_slots"""
+        if quorum is not None and quorum <= 0:
+            raise ValueError("quorum must be positive")
+        max_participants = self.participant_count
+        if not max_participants:
+            return []
+
+        # Rungs are tried strictest first; the first with any candidate wins
+        for rung in get_search_ladder(min_duration, quorum, len(self._bits)):
+            collector = TopSlotCollector(top_k)
+            for index in range(len(self.dates)):
+                slots = self._slots(index, rung)
+                for slot in slots:
+                    slot.score = score_slot(slot, max_participants, prioritize_participants)
+                collector.add_date(slots)
+            if collector.candidate_count:
+                # Candidates are re-scored by later searches
+                return [replace(slot) for slot in collector.results()]
+        return []
@@ -1,8 +1,16 @@
 import csv
+import io
+import mmap
+import os
+import re
+from bisect import bisect_right
 from dataclasses import dataclass, field
 from datetime import time, datetime, date, timedelta
+from functools import partial
 from pathlib import Path
-from typing import List, Set, Tuple, Optional
+from typing import Callable, Dict, Iterable, Iterator, List, Set, Tuple, Optional
+
+from meet_zone.zones import is_known_timezone
 
 
 @dataclass
@@ -15,6 +23,89 @@ class BusySlot:
 	recurring: bool = False  # If True, repeats weekly
 
 
+class _BusyBucket:
+	"""Busy slots that apply under one rule, plus their merged time ranges"""
+	
+	def __init__(self):
+		self.slots: List[Tuple[int, BusySlot]] = []
+		self.starts: List[time] = []
+		self.ends: List[time] = []
+	
+	def add(self, position: int, busy_slot: BusySlot) -> None:
+		self.slots.append((position, busy_slot))
+	
+	def build(self) -> None:
+		"""Sort and merge the time ranges so lookups can bisect"""
+		ranges = sorted(
+			(slot.start_time, slot.end_time) for _, slot in self.slots
+			if slot.start_time < slot.end_time
+		)
+		for start, end in ranges:
+			if self.ends and start <= self.ends[-1]:
+				self.ends[-1] = max(self.ends[-1], end)
+			else:
+				self.starts.append(start)
+				self.ends.append(end)
+	
+	def contains(self, check_time: time) -> bool:
+		k = bisect_right(self.starts, check_time) - 1
+		return k >= 0 and check_time < self.ends[k]
+
+
+class BusySlotIndex:
+	"""Busy slots bucketed as daily, weekly by weekday and one-off by date
+	
+	A lookup is a dict hit per bucket plus a bisect over its merged ranges.
+	"""
+	
+	def __init__(self, busy_slots: List[BusySlot]):
+		self.source = busy_slots
+		self.slot_count = len(busy_slots)
+		self.daily = _BusyBucket()
+		self.weekly: Dict[int, _BusyBucket] = {}
+		self.dated: Dict[date, _BusyBucket] = {}
+		
+		for position, busy_slot in enumerate(busy_slots):
+			if busy_slot.date is None:
+				bucket = self.daily
+			elif busy_slot.recurring:
+				bucket = self.weekly.setdefault(busy_slot.date.weekday(), _BusyBucket())
+			else:
+				bucket = self.dated.setdefault(busy_slot.date, _BusyBucket())
+			bucket.add(position, busy_slot)
+		
+		self.daily.build()
+		for bucket in self.weekly.values():
+			bucket.build()
+		for bucket in self.dated.values():
+			bucket.build()
+	
+	def is_current(self, busy_slots: List[BusySlot]) -> bool:
+		"""Cheap staleness check for slots changed without invalidating"""
+		return busy_slots is self.source and len(busy_slots) == self.slot_count
+	
+	def _buckets_for(self, check_date: date) -> List[_BusyBucket]:
+		buckets = [self.daily]
+		weekly = self.weekly.get(check_date.weekday())
+		if weekly is not None:
+			buckets.append(weekly)
+		dated = self.dated.get(check_date)
+		if dated is not None:
+			buckets.append(dated)
+		return buckets
+	
+	def is_busy_at(self, check_time: time, check_date: date) -> bool:
+		return any(bucket.contains(check_time) for bucket in self._buckets_for(check_date))
+	
+	def slots_for_date(self, check_date: date) -> List[BusySlot]:
+		"""Applicable slots in the order they were added"""
+		buckets = [bucket for bucket in self._buckets_for(check_date) if bucket.slots]
+		if len(buckets) == 1:
+			return [slot for _, slot in buckets[0].slots]
+		entries = sorted(entry for bucket in buckets for entry in bucket.slots)
+		return [slot for _, slot in entries]
+
+
 @dataclass
 class Participant:
 	name: str
@@ -22,6 +113,7 @@ class Participant:
 	start_time: time
 	end_time: time
 	busy_slots: List[BusySlot] = field(default_factory=list)
+	_busy_index: Optional[BusySlotIndex] = field(default=None, init=False, repr=False, compare=False)
 	
 	def add_busy_slot(self, start_time: time, end_time: time, 
 					  date: Optional[date] = None, description: str = "", 
@@ -35,45 +127,36 @@ class Participant:
 			recurring=recurring
 		)
 		self.busy_slots.append(busy_slot)
+		self.invalidate_busy_index()
+	
+	def remove_busy_slot(self, index: int) -> BusySlot:
+		"""Remove and return the busy slot at an index"""
+		busy_slot = self.busy_slots.pop(index)
+		self.invalidate_busy_index()
+		return busy_slot
+	
+	def clear_busy_slots(self) -> None:
+		"""Remove all busy slots"""
+		self.busy_slots.clear()
+		self.invalidate_busy_index()
+	
+	def invalidate_busy_index(self) -> None:
+		"""Drop the busy slot index; call after editing busy slots in place"""
+		self._busy_index = None
+	
+	def get_busy_index(self) -> BusySlotIndex:
+		"""Busy slot index, rebuilt when the slots have changed"""
+		if self._busy_index is None or not self._busy_index.is_current(self.busy_slots):
+			self._busy_index = BusySlotIndex(self.busy_slots)
+		return self._busy_index
 	
 	def is_busy_at(self, check_time: time, check_date: date) -> bool:
 		"""Check if participant is busy at a specific time and date"""
-		for busy_slot in self.busy_slots:
-			# Check if the busy slot applies to this date
-			if busy_slot.date is not None:
-				if busy_slot.recurring:
-					# For recurring slots, check if it's the same day of week
-					if check_date.weekday() != busy_slot.date.weekday():
-						continue
-				else:
-					# For specific date slots, must match exactly
-					if check_date != busy_slot.date:
-						continue
-			
-			# Check if the time falls within the busy slot
-			if busy_slot.start_time <= check_time < busy_slot.end_time:
-				return True
-		
-		return False
+		return self.get_busy_index().is_busy_at(check_time, check_date)
 	
 	def get_busy_slots_for_date(self, check_date: date) -> List[BusySlot]:
 		"""Get all busy slots that apply to a specific date"""
-		applicable_slots = []
-		
-		for busy_slot in self.busy_slots:
-			if busy_slot.date is None:
-				# Applies to all days
-				applicable_slots.append(busy_slot)
-			elif busy_slot.recurring:
-				# Recurring weekly - check day of week
-				if check_date.weekday() == busy_slot.date.weekday():
-					applicable_slots.append(busy_slot)
-			else:
-				# Specific date
-				if check_date == busy_slot.date:
-					applicable_slots.append(busy_slot)
-		
-		return applicable_slots
+		return self.get_busy_index().slots_for_date(check_date)
 
 
 def parse_time(time_str: str) -> time:
@@ -92,59 +175,488 @@ def parse_date(date_str: str) -> Optional[date]:
 		raise ValueError(f"Invalid date format: {date_str}. Use YYYY-MM-DD")
 
 
-def parse_roster(file_path: Path) -> List[Participant]:
-	"""Parse roster file with optional busy schedule information"""
+@dataclass
+class RosterError:
+	"""A roster row, or a busy slot in it, that could not be parsed"""
+	row: int
+	message: str
+
+
+class RosterErrorReport:
+	"""Problems found while loading a roster, keeping at most max_errors of them
+	
+	error_count includes the errors beyond max_errors that were not kept.
+	"""
+	
+	def __init__(self, max_errors: int = 50):
+		self.max_errors = max_errors
+		self.errors: List[RosterError] = []
+		self.error_count = 0
+		self.rows_read = 0
+		self.rows_skipped = 0
+		self.rows_filtered = 0
+	
+	def add(self, row: int, message: str) -> None:
+		self.error_count += 1
+		if len(self.errors) < self.max_errors:
+			self.errors.append(RosterError(row, message))
+	
+	def summary(self) -> str:
+		"""One line of counts followed by the kept errors"""
+		lines = [
+			f"Read {self.rows_read} rows: {self.rows_skipped} skipped, {self.rows_filtered} filtered out, "
+			f"{self.error_count} errors"
+		]
+		lines.extend(f"  row {error.row}: {error.message}" for error in self.errors)
+		if self.error_count > len(self.errors):
+			lines.append(f"  ... and {self.error_count - len(self.errors)} more")
+		return '\n'.join(lines)
+
+
+# A parsed slot's BusySlot fields, or an error as (text before, text after) the participant's name
+BusySlotFields = Tuple[time, time, Optional[date], str, bool]
+BusySlotError = Tuple[str, str]
+
+# A participant sent back by a parse worker: name, tz, start, end, busy slot list index
+PackedParticipant = Tuple[str, str, time, time, int]
+
+
+def roster_columns(header: Optional[List[str]]) -> Tuple[Optional[int], Optional[int]]:
+	"""(team column, busy schedule column) of a roster header, None where absent
+	
+	A "busy_schedule" header names the busy schedule column; otherwise it is
+	the fifth column of a header with more than four.
+	"""
+	columns = [column.strip().lower() for column in header or []]
+	team_column = columns.index('team') if 'team' in columns else None
+	if 'busy_schedule' in columns:
+		busy_column = columns.index('busy_schedule')
+	elif len(columns) > 4 and team_column != 4:
+		busy_column = 4
+	else:
+		busy_column = None
+	return team_column, busy_column
+
+
+def parse_roster_row(row_num: int, row: List[str], busy_column: Optional[int],
+					 busy_parser: 'BusyScheduleParser', warn: Callable[[int, str], None]) -> Participant:
+	"""Participant of a roster row with at least four columns
+	
+	Busy slots that cannot be parsed go to warn; a row that cannot be
+	parsed at all, or names an unknown timezone, raises ValueError.
+	"""
+	name, tz, start_time_str, end_time_str = row[:4]
+	if not is_known_timezone(tz):
+		raise ValueError(f"Unknown timezone: {tz}")
+	participant = Participant(
+		name=name,
+		tz=tz,
+		start_time=parse_time(start_time_str),
+		end_time=parse_time(end_time_str)
+	)
+	
+	# Parse busy schedule if present
+	if busy_column is not None and len(row) > busy_column:
+		busy_schedule_str = row[busy_column]
+		if busy_schedule_str.strip():
+			parse_busy_schedule(participant, busy_schedule_str, lambda message: warn(row_num, message),
+								busy_parser)
+	return participant
+
+
+def _read_roster_rows(rows: Iterable[Tuple[int, List[str]]], team_column: Optional[int],
+					  busy_column: Optional[int], wanted_names: Optional[Set[str]],
+					  wanted_teams: Optional[Set[str]], busy_parser: 'BusyScheduleParser',
+					  warn: Callable[[int, str], None], skip: Callable[[int, str], None],
+					  report: Optional[RosterErrorReport]) -> Iterator[Participant]:
+	"""Participants of numbered CSV rows; report only gets the read and filtered counts"""
+	for row_num, row in rows:
+		if report is not None:
+			report.rows_read += 1
+		if len(row) < 4:
+			skip(row_num, "insufficient columns")
+			continue
+		
+		name = row[0]
+		team = row[team_column].strip() if team_column is not None and team_column < len(row) else None
+		if (wanted_names is not None and name not in wanted_names) or (
+			wanted_teams is not None and team not in wanted_teams
+		):
+			if report is not None:
+				report.rows_filtered += 1
+			continue
+		
+		try:
+			participant = parse_roster_row(row_num, row, busy_column, busy_parser, warn)
+		except ValueError as e:
+			skip(row_num, str(e))
+			continue
+		
+		yield participant
+
+
+def roster_problem_handlers(report: Optional[RosterErrorReport]) -> Tuple[Callable[[int, str], None],
+																		   Callable[[int, str], None]]:
+	"""(warn, skip) callbacks adding to report, or printing without one"""
+	def warn(row_num: int, message: str) -> None:
+		if report is not None:
+			report.add(row_num, message)
+		else:
+			print(f"Warning: {message}")
+	
+	def skip(row_num: int, message: str) -> None:
+		if report is not None:
+			report.rows_skipped += 1
+			report.add(row_num, message)
+		else:
+			print(f"Skipping row {row_num}: {message}")
+	
+	return warn, skip
+
+
+def iter_roster(file_path: Path, chunk_size: int = 1000, names: Optional[Iterable[str]] = None,
+				teams: Optional[Iterable[str]] = None,
+				report: Optional[RosterErrorReport] = None) -> Iterator[List[Participant]]:
+	"""Stream a roster file as lists of at most chunk_size participants
+	
+	Rows are matched against names and, when the header has a "team" column,
+	teams before anything else in them is parsed, so filtered-out rows cost
+	almost nothing. The busy schedule column is found by roster_columns.
+	Errors are added to report, or printed when there is none.
+	"""
+	if chunk_size <= 0:
+		raise ValueError("chunk_size must be positive")
 	if not file_path.exists():
 		raise FileNotFoundError(f"Roster file not found: {file_path}")
 	
-	participants = []
+	wanted_names = set(names) if names is not None else None
+	wanted_teams = set(teams) if teams is not None else None
+	warn, skip = roster_problem_handlers(report)
 	
 	with open(file_path, 'r', newline='') as csvfile:
 		reader = csv.reader(csvfile)
 		header = next(reader, None)
 		
 		# Determine CSV format based on header
-		if header and len(header) >= 4:
-			has_busy_schedule = len(header) > 4
-		else:
-			has_busy_schedule = False
+		team_column, busy_column = roster_columns(header)
+		if wanted_teams is not None and team_column is None:
+			raise ValueError("Roster file has no team column to filter on")
 		
-		for row_num, row in enumerate(reader, start=2):
-			if len(row) < 4:
-				print(f"Skipping row {row_num}: insufficient columns")
-				continue
-			
-			name, tz, start_time_str, end_time_str = row[:4]
-			
-			try:
-				start_time = parse_time(start_time_str)
-				end_time = parse_time(end_time_str)
-				
-				participant = Participant(
-					name=name,
-					tz=tz,
-					start_time=start_time,
-					end_time=end_time
-				)
-				
-				# Parse busy schedule if present
-				if has_busy_schedule and len(row) > 4:
-					busy_schedule_str = row[4] if len(row) > 4 else ""
-					if busy_schedule_str.strip():
-						parse_busy_schedule(participant, busy_schedule_str)
-				
-				participants.append(participant)
-				
-			except ValueError as e:
-				print(f"Skipping row {row_num}: {e}")
+		chunk: List[Participant] = []
+		for participant in _read_roster_rows(enumerate(reader, start=2), team_column, busy_column,
+											 wanted_names, wanted_teams, BusyScheduleParser(),
+											 warn, skip, report):
+			chunk.append(participant)
+			if len(chunk) >= chunk_size:
+				yield chunk
+				chunk = []
+		
+		if chunk:
+			yield chunk
+
+
+def find_record_boundaries(file_path: Path, block_size: int) -> List[int]:
+	"""Byte offsets of CSV record starts, about block_size apart, from the end of the header
+	
+	A newline ends a record when an even number of quote characters
+	precedes it, which holds for CSV whose quotes only enclose fields (as
+	csv writers produce), so quoted fields may contain newlines. The last
+	offset is the file size.
+	"""
+	if block_size <= 0:
+		raise ValueError("block_size must be positive")
+	with open(file_path, 'rb') as f:
+		if not os.fstat(f.fileno()).st_size:
+			return [0]
+		with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+			return _scan_record_boundaries(data, block_size)
+
+
+def _scan_record_boundaries(data: mmap.mmap, block_size: int) -> List[int]:
+	def record_end(pos: int, quotes: int) -> Tuple[int, int]:
+		# First record boundary at or after pos, with the quote count before it
+		while True:
+			newline = data.find(b'\n', pos)
+			if newline < 0:
+				return len(data), quotes
+			quotes += data[pos:newline].count(b'"')
+			pos = newline + 1
+			if quotes % 2 == 0:
+				return pos, quotes
+	
+	pos, quotes = record_end(0, 0)
+	boundaries = [pos]
+	while pos < len(data):
+		target = pos + block_size
+		if target >= len(data):
+			boundaries.append(len(data))
+			break
+		pos, quotes = record_end(target, quotes + data[pos:target].count(b'"'))
+		boundaries.append(pos)
+	return boundaries
+
+
+def _parse_roster_block(start: int, end: int, file_path: Path, team_column: Optional[int],
+						busy_column: Optional[int], wanted_names: Optional[Set[str]],
+						wanted_teams: Optional[Set[str]],
+						today: date) -> Tuple[List[PackedParticipant], List[List[BusySlotFields]], int, int,
+											  List[Tuple[int, str, bool]]]:
+	"""Parse the records in a byte range of a roster in a worker process
+	
+	Returns the packed participants and the busy slot lists they index,
+	the number of records read and filtered out, and the problems as
+	(record index in the block, message, row skipped).
+	"""
+	with open(file_path, 'rb') as f:
+		f.seek(start)
+		block = f.read(end - start)
+	
+	problems: List[Tuple[int, str, bool]] = []
+	counts = RosterErrorReport(max_errors=0)
+	rows = enumerate(csv.reader(io.TextIOWrapper(io.BytesIO(block), newline='')))
+	participants = list(_read_roster_rows(
+		rows, team_column, busy_column, wanted_names, wanted_teams, BusyScheduleParser(today),
+		lambda index, message: problems.append((index, message, False)),
+		lambda index, message: problems.append((index, message, True)),
+		counts
+	))
+	
+	# Participants are rebuilt by the parent, so send plain tuples with each
+	# time and busy slot list once rather than pickling every object
+	times: Dict[time, time] = {}
+	schedules: Dict[Tuple[BusySlotFields, ...], int] = {}
+	packed = [
+		(
+			participant.name,
+			participant.tz,
+			times.setdefault(participant.start_time, participant.start_time),
+			times.setdefault(participant.end_time, participant.end_time),
+			schedules.setdefault(tuple(
+				(slot.start_time, slot.end_time, slot.date, slot.description, slot.recurring)
+				for slot in participant.busy_slots
+			), len(schedules))
+		)
+		for participant in participants
+	]
+	return packed, [list(schedule) for schedule in schedules], counts.rows_read, counts.rows_filtered, problems
+
+
+def parse_roster_parallel(file_path: Path, workers: Optional[int] = None, names: Optional[Iterable[str]] = None,
+						  teams: Optional[Iterable[str]] = None, report: Optional[RosterErrorReport] = None,
+						  block_size: int = 4 << 20) -> List[Participant]:
+	"""Parse a roster on a process pool, with the same result and problems as parse_roster
 	
+	The file is split at record boundaries (see find_record_boundaries)
+	into blocks of about block_size bytes, each parsed by a worker; the
+	participants are merged in file order and problems are reported in
+	order with their row numbers in the whole file. A file of one block is
+	parsed in this process.
+	"""
+	from concurrent.futures import ProcessPoolExecutor
+	
+	if not file_path.exists():
+		raise FileNotFoundError(f"Roster file not found: {file_path}")
+	boundaries = find_record_boundaries(file_path, block_size)
+	if len(boundaries) <= 2:
+		return parse_roster(file_path, names=names, teams=teams, report=report)
+	
+	with open(file_path, 'rb') as f:
+		header_bytes = f.read(boundaries[0])
+	header = next(csv.reader(io.TextIOWrapper(io.BytesIO(header_bytes), newline='')), None)
+	team_column, busy_column = roster_columns(header)
+	wanted_names = set(names) if names is not None else None
+	wanted_teams = set(teams) if teams is not None else None
+	if wanted_teams is not None and team_column is None:
+		raise ValueError("Roster file has no team column to filter on")
+	
+	warn, skip = roster_problem_handlers(report)
+	today = datetime.now().date()
+	participants: List[Participant] = []
+	row_num = 2
+	with ProcessPoolExecutor(max_workers=workers) as executor:
+		parse_block = partial(_parse_roster_block, file_path=file_path, team_column=team_column,
+							  busy_column=busy_column, wanted_names=wanted_names, wanted_teams=wanted_teams,
+							  today=today)
+		results = executor.map(parse_block, boundaries[:-1], boundaries[1:])
+		for packed, schedules, rows_read, rows_filtered, problems in results:
+			participants.extend(
+				Participant(name, tz, start_time, end_time, [BusySlot(*fields) for fields in schedules[schedule]])
+				for name, tz, start_time, end_time, schedule in packed
+			)
+			for index, message, skipped in problems:
+				(skip if skipped else warn)(row_num + index, message)
+			if report is not None:
+				report.rows_read += rows_read
+				report.rows_filtered += rows_filtered
+			row_num += rows_read
+	
+	return _check_roster(participants, names, teams)
+
+
+def parse_roster(file_path: Path, names: Optional[Iterable[str]] = None, teams: Optional[Iterable[str]] = None,
+				 report: Optional[RosterErrorReport] = None, workers: int = 1,
+				 cache: bool = False) -> List[Participant]:
+	"""Parse roster file with optional busy schedule information
+	
+	names and teams keep only matching rows (see iter_roster); problems are
+	collected in report if one is given, and printed otherwise. workers
+	above 1 parses a large file on that many processes (see
+	parse_roster_parallel). cache reads the roster from a binary sidecar
+	file next to it, written on first use and whenever the CSV changes
+	(see roster_cache); workers is then ignored.
+	"""
+	if cache:
+		from meet_zone.roster_cache import load_cached_roster
+		return _check_roster(load_cached_roster(file_path, names=names, teams=teams, report=report), names, teams)
+	if workers > 1:
+		return parse_roster_parallel(file_path, workers, names=names, teams=teams, report=report)
+	
+	participants = [
+		participant
+		for chunk in iter_roster(file_path, names=names, teams=teams, report=report)
+		for participant in chunk
+	]
+	return _check_roster(participants, names, teams)
+
+
+def _check_roster(participants: List[Participant], names: Optional[Iterable[str]],
+				  teams: Optional[Iterable[str]]) -> List[Participant]:
 	if not participants:
+		if names is not None or teams is not None:
+			raise ValueError("No participants in roster file match the filter")
 		raise ValueError("No valid participants found in roster file")
-	
 	return participants
 
 
-def parse_busy_schedule(participant: Participant, busy_schedule_str: str) -> None:
+# Day names accepted after '@' for weekly recurring busy slots
+DAY_NAMES = {
+	'mon': 0, 'monday': 0,
+	'tue': 1, 'tuesday': 1,
+	'wed': 2, 'wednesday': 2,
+	'thu': 3, 'thursday': 3,
+	'fri': 4, 'friday': 4,
+	'sat': 5, 'saturday': 5,
+	'sun': 6, 'sunday': 6
+}
+
+# One busy slot: HH:MM-HH:MM, optionally followed by @date-or-day[:description]
+BUSY_SLOT_PATTERN = re.compile(
+	r'(\d{1,2}):(\d{1,2})\s*-\s*(\d{1,2}):(\d{1,2})'
+	r'(?:\s*@\s*([^:]*?)\s*(?::\s*(.*))?)?',
+	re.ASCII | re.DOTALL
+)
+ISO_DATE_PATTERN = re.compile(r'(\d{4})-(\d{2})-(\d{2})', re.ASCII)
+
+
+class BusyScheduleParser:
+	"""Compiled busy_schedule parser shared by every row of one roster load
+	
+	Weekday names resolve against a reference date fixed when the parser is
+	created (their next occurrence after today), each slot is matched by a
+	precompiled pattern, and each distinct schedule string is parsed once.
+	Slots the pattern does not accept go through the general rules of
+	parse_busy_slot, so the accepted syntax and error messages are unchanged.
+	"""
+	
+	def __init__(self, today: Optional[date] = None):
+		today = today or datetime.now().date()
+		self.weekday_dates = [
+			today + timedelta(days=(weekday - today.weekday() - 1) % 7 + 1)
+			for weekday in range(7)
+		]
+		self._cache: Dict[str, Tuple[List[BusySlotFields], List[BusySlotError]]] = {}
+	
+	def parse(self, busy_schedule_str: str) -> Tuple[List[BusySlotFields], List[BusySlotError]]:
+		"""Slots and errors of a schedule string, memoized per string"""
+		parsed = self._cache.get(busy_schedule_str)
+		if parsed is None:
+			slots: List[BusySlotFields] = []
+			errors: List[BusySlotError] = []
+			for slot_str in busy_schedule_str.split(';'):
+				slot_str = slot_str.strip()
+				if not slot_str:
+					continue
+				try:
+					slots.append(self.parse_slot(slot_str))
+				except BusySlotSyntaxError as e:
+					errors.append((f"Invalid time range format '{e.args[0]}' for ", ""))
+				except Exception as e:
+					errors.append((f"Could not parse busy slot '{slot_str}' for ", f": {e}"))
+			parsed = self._cache[busy_schedule_str] = (slots, errors)
+		return parsed
+	
+	def parse_slot(self, slot_str: str) -> BusySlotFields:
+		match = BUSY_SLOT_PATTERN.fullmatch(slot_str)
+		if match is None:
+			return parse_busy_slot(slot_str, self.weekday_dates)
+		
+		start_hour, start_minute, end_hour, end_minute, date_part, description = match.groups()
+		start_time = time(int(start_hour), int(start_minute))
+		end_time = time(int(end_hour), int(end_minute))
+		description = description or ""
+		if not date_part:
+			return start_time, end_time, None, description, False
+		weekday = DAY_NAMES.get(date_part.lower())
+		if weekday is not None:
+			return start_time, end_time, self.weekday_dates[weekday], description, True
+		iso_date = ISO_DATE_PATTERN.fullmatch(date_part)
+		if iso_date is not None:
+			try:
+				return start_time, end_time, date(*map(int, iso_date.groups())), description, False
+			except ValueError:
+				pass  # parse_date reports it in its own words
+		return start_time, end_time, parse_date(date_part), description, False
+
+
+class BusySlotSyntaxError(ValueError):
+	"""A busy slot without a start-end time range"""
+
+
+def parse_busy_slot(slot_str: str, weekday_dates: List[date]) -> BusySlotFields:
+	"""General rules for one busy slot, for forms the compiled pattern does not cover"""
+	parts = slot_str.split('@', 1)
+	time_part = parts[0].strip()
+	
+	# Parse time range
+	if '-' not in time_part:
+		raise BusySlotSyntaxError(time_part)
+	
+	start_str, end_str = time_part.split('-', 1)
+	start_time = parse_time(start_str.strip())
+	end_time = parse_time(end_str.strip())
+	
+	# Parse date/description part if present
+	busy_date = None
+	description = ""
+	recurring = False
+	
+	if len(parts) > 1:
+		date_desc_part = parts[1].strip()
+		
+		# Check if it contains description (separated by colon)
+		if ':' in date_desc_part:
+			date_part, description = date_desc_part.split(':', 1)
+			date_part = date_part.strip()
+			description = description.strip()
+		else:
+			date_part = date_desc_part
+		
+		# Parse date part
+		if date_part:
+			if date_part.lower() in DAY_NAMES:
+				# Recurring weekly on the next occurrence of this weekday
+				busy_date = weekday_dates[DAY_NAMES[date_part.lower()]]
+				recurring = True
+			else:
+				# Specific date
+				busy_date = parse_date(date_part)
+	
+	return start_time, end_time, busy_date, description, recurring
+
+
+def parse_busy_schedule(participant: Participant, busy_schedule_str: str,
+						on_error: Optional[Callable[[str], None]] = None,
+						parser: Optional[BusyScheduleParser] = None) -> None:
 	"""Parse busy schedule string and add to participant
 	
 	Format examples:
@@ -153,82 +665,24 @@ def parse_busy_schedule(participant: Participant, busy_schedule_str: str) -> Non
 	- "09:00-10:00@2023-12-25:Meeting" (with description)
 	- "09:00-10:00@Mon:Weekly standup" (recurring weekly)
 	- Multiple slots separated by semicolons: "09:00-10:00;14:00-15:00"
+	
+	Slots that cannot be parsed are skipped; each is reported to on_error,
+	or printed as a warning without one. Pass one parser to every call of a
+	roster load to share its reference date and cache.
 	"""
 	if not busy_schedule_str.strip():
 		return
 	
-	# Split multiple busy slots
-	slots = [slot.strip() for slot in busy_schedule_str.split(';') if slot.strip()]
-	
-	for slot_str in slots:
-		try:
-			# Parse individual busy slot
-			parts = slot_str.split('@', 1)
-			time_part = parts[0].strip()
-			
-			# Parse time range
-			if '-' not in time_part:
-				print(f"Warning: Invalid time range format '{time_part}' for {participant.name}")
-				continue
-			
-			start_str, end_str = time_part.split('-', 1)
-			start_time = parse_time(start_str.strip())
-			end_time = parse_time(end_str.strip())
-			
-			# Parse date/description part if present
-			busy_date = None
-			description = ""
-			recurring = False
-			
-			if len(parts) > 1:
-				date_desc_part = parts[1].strip()
-				
-				# Check if it contains description (separated by colon)
-				if ':' in date_desc_part:
-					date_part, description = date_desc_part.split(':', 1)
-					date_part = date_part.strip()
-					description = description.strip()
-				else:
-					date_part = date_desc_part
-				
-				# Parse date part
-				if date_part:
-					# Check for day names (recurring weekly)
-					day_names = {
-						'mon': 0, 'monday': 0,
-						'tue': 1, 'tuesday': 1,
-						'wed': 2, 'wednesday': 2,
-						'thu': 3, 'thursday': 3,
-						'fri': 4, 'friday': 4,
-						'sat': 5, 'saturday': 5,
-						'sun': 6, 'sunday': 6
-					}
-					
-					if date_part.lower() in day_names:
-						# Recurring weekly - create a reference date for the weekday
-						weekday = day_names[date_part.lower()]
-						# Use next occurrence of this weekday as reference
-						today = datetime.now().date()
-						days_ahead = weekday - today.weekday()
-						if days_ahead <= 0:
-							days_ahead += 7
-						busy_date = today + timedelta(days=days_ahead)
-						recurring = True
-					else:
-						# Specific date
-						busy_date = parse_date(date_part)
-			
-			# Add the busy slot
-			participant.add_busy_slot(
-				start_time=start_time,
-				end_time=end_time,
-				date=busy_date,
-				description=description,
-				recurring=recurring
-			)
-			
-		except Exception as e:
-			print(f"Warning: Could not parse busy slot '{slot_str}' for {participant.name}: {e}")
+	slots, errors = (parser or BusyScheduleParser()).parse(busy_schedule_str)
+	if slots:
+		participant.busy_slots.extend(BusySlot(*fields) for fields in slots)
+		participant.invalidate_busy_index()
+	for before, after in errors:
+		message = f"{before}{participant.name}{after}"
+		if on_error is not None:
+			on_error(message)
+		else:
+			print(f"Warning: {message}")
 
 
 def export_roster_with_busy_schedule(participants: List[Participant], file_path: Path) -> bool:
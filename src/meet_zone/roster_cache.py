@@ -0,0 +1,354 @@
+"""
+Binary roster cache: a parsed roster saved in a sidecar file next to its CSV
+
+parse_roster(..., cache=True) loads ROSTER.csv from ROSTER.csv.mzcache when
+that file matches the CSV's size and modification time (or, if only the
+time differs, its content hash), and otherwise parses the CSV and writes the
+sidecar. The sidecar holds every row, unfiltered, in typed columns
+(array.array) with each string stored once in a table, so loading it only
+rebuilds the Participant objects; name and team filters and the reported
+problems behave as for a fresh parse.
+
+Layout, all integers in native byte order:
+
+    header    magic, format version, byte order, source size, mtime and hash
+    strings   count and text size, then the length in characters of each
+              string, then their concatenated UTF-8 text
+    columns   per column: type code, item count, the raw array bytes
+"""
+
+import gc
+import hashlib
+import logging
+import os
+import struct
+import sys
+from array import array
+from itertools import accumulate
+from datetime import date, time
+from pathlib import Path
+from typing import BinaryIO, Dict, Iterable, List, Optional, Set, Tuple
+
+from meet_zone.parser import (
+    BusyScheduleParser, BusySlot, Participant, RosterErrorReport, parse_roster_row, roster_columns,
+    roster_problem_handlers
+)
+
+CACHE_SUFFIX = ".mzcache"
+CACHE_MAGIC = b"MZRC"
+CACHE_VERSION = 2
+
+# magic, version, little-endian flag, has team column, source size, mtime_ns, hash
+_HEADER = struct.Struct("=4sHBBqq16s")
+
+# Row kinds
+ROW_PARTICIPANT = 0
+ROW_SHORT = 1  # fewer than four columns, skipped before filtering
+ROW_SKIPPED = 2  # could not be parsed
+
+# Busy slot date column: a date ordinal, NO_DATE, or -(weekday + 1) for a weekly slot
+NO_DATE = 0
+
+logger = logging.getLogger(__name__)
+
+
+def cache_path(file_path: Path) -> Path:
+    return file_path.with_name(file_path.name + CACHE_SUFFIX)
+
+
+def file_hash(file_path: Path) -> bytes:
+    digest = hashlib.blake2b(digest_size=16)
+    with open(file_path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.digest()
+
+
+class RosterTable:
+    """Every row of a roster file, parsed but not filtered, in columns
+
+    Row i is CSV row i + 2 (row 1 is the header). Rows index their busy
+    slots and problems through cumulative end offsets, and every string
+    column holds indexes into strings.
+    """
+
+    # Column name and array type code, in file order
+    COLUMNS = (
+        ("kinds", "B"), ("names", "I"), ("teams", "i"), ("zones", "I"), ("starts", "H"), ("ends", "H"),
+        ("slot_ends", "I"), ("problem_ends", "I"),
+        ("slot_starts", "H"), ("slot_stops", "H"), ("slot_dates", "i"), ("slot_descriptions", "I"),
+        ("problem_messages", "I"), ("problem_skipped", "B"),
+    )
+
+    def __init__(self, has_team_column: bool, strings: Optional[List[str]] = None):
+        self.has_team_column = has_team_column
+        self.strings: List[str] = strings if strings is not None else []
+        self._string_ids: Optional[Dict[str, int]] = None  # built by the first intern()
+        for column, typecode in self.COLUMNS:
+            setattr(self, column, array(typecode))
+
+    def __len__(self) -> int:
+        return len(self.kinds)
+
+    def intern(self, string: str) -> int:
+        if self._string_ids is None:
+            self._string_ids = {string: index for index, string in enumerate(self.strings)}
+        index = self._string_ids.get(string)
+        if index is None:
+            index = self._string_ids[string] = len(self.strings)
+            self.strings.append(string)
+        return index
+
+    @classmethod
+    def from_csv(cls, file_path: Path) -> "RosterTable":
+        """Parse every row of a roster file as iter_roster would without filters"""
+        import csv
+
+        with open(file_path, "r", newline="") as csvfile:
+            reader = csv.reader(csvfile)
+            team_column, busy_column = roster_columns(next(reader, None))
+            table = cls(team_column is not None)
+            busy_parser = BusyScheduleParser()
+            problems: List[Tuple[str, bool]] = []
+            warn = lambda row_num, message: problems.append((message, False))
+
+            for row_num, row in enumerate(reader, start=2):
+                problems.clear()
+                participant = None
+                if len(row) < 4:
+                    kind = ROW_SHORT
+                    problems.append(("insufficient columns", True))
+                else:
+                    try:
+                        participant = parse_roster_row(row_num, row, busy_column, busy_parser, warn)
+                        kind = ROW_PARTICIPANT
+                    except ValueError as e:
+                        problems.append((str(e), True))
+                        kind = ROW_SKIPPED
+                team = row[team_column].strip() if team_column is not None and team_column < len(row) else None
+                table.add_row(kind, row[0] if row else "", team, participant, problems)
+        return table
+
+    def add_row(self, kind: int, name: str, team: Optional[str], participant: Optional[Participant],
+                problems: Iterable[Tuple[str, bool]]) -> None:
+        self.kinds.append(kind)
+        self.names.append(self.intern(name))
+        self.teams.append(self.intern(team) if team is not None else -1)
+        if participant is not None:
+            self.zones.append(self.intern(participant.tz))
+            self.starts.append(participant.start_time.hour * 60 + participant.start_time.minute)
+            self.ends.append(participant.end_time.hour * 60 + participant.end_time.minute)
+            for busy_slot in participant.busy_slots:
+                self.slot_starts.append(busy_slot.start_time.hour * 60 + busy_slot.start_time.minute)
+                self.slot_stops.append(busy_slot.end_time.hour * 60 + busy_slot.end_time.minute)
+                if busy_slot.date is None:
+                    self.slot_dates.append(NO_DATE)
+                elif busy_slot.recurring:
+                    self.slot_dates.append(-(busy_slot.date.weekday() + 1))
+                else:
+                    self.slot_dates.append(busy_slot.date.toordinal())
+                self.slot_descriptions.append(self.intern(busy_slot.description))
+        else:
+            self.zones.append(0)
+            self.starts.append(0)
+            self.ends.append(0)
+        self.slot_ends.append(len(self.slot_starts))
+        for message, skipped in problems:
+            self.problem_messages.append(self.intern(message))
+            self.problem_skipped.append(skipped)
+        self.problem_ends.append(len(self.problem_messages))
+
+    def participants(self, names: Optional[Iterable[str]] = None, teams: Optional[Iterable[str]] = None,
+                     report: Optional[RosterErrorReport] = None, today: Optional[date] = None) -> List[Participant]:
+        """Participants of the matching rows, reporting problems as iter_roster does
+
+        Weekly busy slots fall on their weekday's next occurrence after today.
+        """
+        strings = self.strings
+        wanted_names = self._string_indexes(names) if names is not None else None
+        wanted_teams = self._string_indexes(teams) if teams is not None else None
+        if wanted_teams is not None and not self.has_team_column:
+            raise ValueError("Roster file has no team column to filter on")
+        warn, skip = roster_problem_handlers(report)
+
+        times = [time(minutes // 60, minutes % 60) for minutes in range(24 * 60)]
+        weekday_dates = BusyScheduleParser(today).weekday_dates
+        dates: Dict[int, Optional[date]] = {NO_DATE: None}
+        for slot_date in set(self.slot_dates):
+            if slot_date not in dates:
+                dates[slot_date] = weekday_dates[-slot_date - 1] if slot_date < 0 else date.fromordinal(slot_date)
+        busy_slots = [
+            BusySlot(times[start], times[stop], dates[slot_date], strings[description], slot_date < 0)
+            for start, stop, slot_date, description in zip(
+                self.slot_starts, self.slot_stops, self.slot_dates, self.slot_descriptions
+            )
+        ]
+
+        participants: List[Participant] = []
+        slot_start = problem_start = 0
+        for row_num, (kind, name, team, zone, start, end, slot_end, problem_end) in enumerate(zip(
+            self.kinds, self.names, self.teams, self.zones, self.starts, self.ends, self.slot_ends, self.problem_ends
+        ), start=2):
+            if report is not None:
+                report.rows_read += 1
+            if kind != ROW_SHORT and (
+                (wanted_names is not None and name not in wanted_names)
+                or (wanted_teams is not None and team not in wanted_teams)
+            ):
+                if report is not None:
+                    report.rows_filtered += 1
+            else:
+                for problem in range(problem_start, problem_end):
+                    (skip if self.problem_skipped[problem] else warn)(row_num, strings[self.problem_messages[problem]])
+                if kind == ROW_PARTICIPANT:
+                    participants.append(Participant(strings[name], strings[zone], times[start], times[end],
+                                                    busy_slots[slot_start:slot_end]))
+            slot_start, problem_start = slot_end, problem_end
+        return participants
+
+    def _string_indexes(self, wanted: Iterable[str]) -> Set[int]:
+        wanted = set(wanted)
+        return {index for index, string in enumerate(self.strings) if string in wanted}
+
+    def header(self, size: int, mtime_ns: int, source_hash: bytes) -> bytes:
+        return _HEADER.pack(CACHE_MAGIC, CACHE_VERSION, sys.byteorder == "little", self.has_team_column,
+                            size, mtime_ns, source_hash)
+
+    def write(self, stream: BinaryIO, size: int, mtime_ns: int, source_hash: bytes) -> None:
+        stream.write(self.header(size, mtime_ns, source_hash))
+        lengths = array("I", map(len, self.strings))
+        text = "".join(self.strings).encode("utf-8", "surrogatepass")
+        stream.write(struct.pack("=II", len(lengths), len(text)))
+        stream.write(lengths.tobytes())
+        stream.write(text)
+        for column, typecode in self.COLUMNS:
+            values = getattr(self, column)
+            stream.write(struct.pack("=cI", typecode.encode(), len(values)))
+            stream.write(values.tobytes())
+
+    @classmethod
+    def read(cls, data: bytes, size: int, mtime_ns: int, source_hash: Optional[bytes] = None) -> Optional["RosterTable"]:
+        """Table from sidecar bytes, or None if they are stale or not a readable cache
+
+        The source must match size and either mtime_ns or, when given,
+        source_hash.
+        """
+        try:
+            magic, version, little_endian, has_team_column, cached_size, cached_mtime, cached_hash = (
+                _HEADER.unpack_from(data)
+            )
+            if (magic, version, bool(little_endian)) != (CACHE_MAGIC, CACHE_VERSION, sys.byteorder == "little"):
+                return None
+            if cached_size != size or (cached_mtime != mtime_ns and cached_hash != source_hash):
+                return None
+
+            offset = _HEADER.size
+            count, text_size = struct.unpack_from("=II", data, offset)
+            offset += 8
+            lengths = array("I")
+            lengths.frombytes(data[offset:offset + count * lengths.itemsize])
+            offset += count * lengths.itemsize
+            # Decoded at once, then cut into strings by their lengths
+            text = data[offset:offset + text_size].decode("utf-8", "surrogatepass")
+            offset += text_size
+            if len(text) != sum(lengths):
+                return None
+            ends = list(accumulate(lengths))
+            strings = [text[start:end] for start, end in zip([0] + ends, ends)]
+
+            table = cls(bool(has_team_column), strings)
+            for column, typecode in cls.COLUMNS:
+                stored_typecode, count = struct.unpack_from("=cI", data, offset)
+                offset += struct.calcsize("=cI")
+                values = getattr(table, column)
+                if stored_typecode != typecode.encode():
+                    return None
+                end = offset + count * values.itemsize
+                if end > len(data):
+                    return None
+                values.frombytes(data[offset:end])
+                offset = end
+        except (struct.error, UnicodeDecodeError, ValueError):
+            return None
+        return table if table.is_consistent() else None
+
+    def is_consistent(self) -> bool:
+        """Whether the columns fit together, so reading rows cannot fail"""
+        rows = len(self)
+        if any(len(column) != rows for column in (self.names, self.teams, self.zones, self.starts, self.ends,
+                                                  self.slot_ends, self.problem_ends)):
+            return False
+        slots = len(self.slot_starts)
+        if any(len(column) != slots for column in (self.slot_stops, self.slot_dates, self.slot_descriptions)):
+            return False
+        if len(self.problem_skipped) != len(self.problem_messages):
+            return False
+        if rows and (self.slot_ends[-1] != slots or self.problem_ends[-1] != len(self.problem_messages)):
+            return False
+        minutes = 24 * 60
+        string_columns = (self.names, self.zones, self.slot_descriptions, self.problem_messages)
+        return (
+            all(max(column, default=-1) < len(self.strings) for column in string_columns + (self.teams,))
+            and max(self.starts, default=0) < minutes and max(self.ends, default=0) < minutes
+            and max(self.slot_starts, default=0) < minutes and max(self.slot_stops, default=0) < minutes
+            and max(self.kinds, default=0) <= ROW_SKIPPED
+        )
+
+
+def load_roster_table(file_path: Path) -> RosterTable:
+    """Table of a roster file from its sidecar, parsing the CSV and rewriting the sidecar if that is stale"""
+    if not file_path.exists():
+        raise FileNotFoundError(f"Roster file not found: {file_path}")
+    stat = file_path.stat()
+    sidecar = cache_path(file_path)
+
+    source_hash = None
+    try:
+        data = sidecar.read_bytes()
+    except OSError:
+        data = None
+    if data is not None:
+        table = RosterTable.read(data, stat.st_size, stat.st_mtime_ns)
+        if table is None:
+            # Touched but maybe unchanged: compare content before reparsing
+            source_hash = file_hash(file_path)
+            table = RosterTable.read(data, stat.st_size, stat.st_mtime_ns, source_hash)
+        if table is not None:
+            if source_hash is not None:
+                _restamp(sidecar, table, stat.st_size, stat.st_mtime_ns, source_hash)
+            return table
+
+    table = RosterTable.from_csv(file_path)
+    # Written under a temporary name so readers never see a partial sidecar
+    temp_path = sidecar.with_name(f"{sidecar.name}.{os.getpid()}.tmp")
+    try:
+        with open(temp_path, "wb") as f:
+            table.write(f, stat.st_size, stat.st_mtime_ns, source_hash or file_hash(file_path))
+        os.replace(temp_path, sidecar)
+    except OSError as e:
+        logger.warning("Could not write roster cache %s: %s", sidecar, e)
+        temp_path.unlink(missing_ok=True)
+    return table
+
+
+def _restamp(sidecar: Path, table: RosterTable, size: int, mtime_ns: int, source_hash: bytes) -> None:
+    """Record a new mtime for an unchanged source, so later loads skip hashing it"""
+    try:
+        with open(sidecar, "r+b") as f:
+            f.write(table.header(size, mtime_ns, source_hash))
+    except OSError:
+        pass  # the cache still works, it is only hashed again next time
+
+
+def load_cached_roster(file_path: Path, names: Optional[Iterable[str]] = None, teams: Optional[Iterable[str]] = None,
+                       report: Optional[RosterErrorReport] = None) -> List[Participant]:
+    """Participants of a roster through its sidecar cache (see parse_roster)"""
+    table = load_roster_table(file_path)
+    # Building many objects at once triggers full collections that find nothing to free
+    gc_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        return table.participants(names, teams, report)
+    finally:
+        if gc_enabled:
+            gc.enable()
@@ -1,10 +1,50 @@
 import datetime
-from dataclasses import dataclass
+import heapq
+import os
+import logging
+from bisect import bisect_left, bisect_right
+from collections import deque
+from dataclasses import dataclass, replace
+from functools import partial
+from time import perf_counter
 from datetime import datetime, time, timedelta
-from typing import Dict, List, Optional, Set
+from typing import TYPE_CHECKING, Any, Callable, Deque, Dict, Iterator, List, Optional, Set, Tuple
 from zoneinfo import ZoneInfo
 
+from meet_zone.availability import MINUTES_PER_DAY, AvailabilityProfile, get_roster_fingerprint, group_participants, intervals_to_mask, iter_mask_bits, iter_mask_runs
+from meet_zone.cache import SlotCache
 from meet_zone.parser import Participant
+from meet_zone.tracing import TRACE_DETAIL, TRACE_SUMMARY, SearchStats, Tracer, timed_phase
+from meet_zone.zones import ZoneOffsetResolver, date_to_minutes, default_resolver, is_known_timezone, minutes_to_datetime
+
+if TYPE_CHECKING:
+    # concurrent.futures pulls in multiprocessing; it is only imported for pools
+    from concurrent.futures import Executor, Future
+
+# Availability engines selectable from find_best_slots
+ENGINES = ("grid", "bitset", "sweep")
+
+logger = logging.getLogger(__name__)
+
+# Minimum duration tried when nothing meets the requested one
+FALLBACK_DURATION_MINUTES = 15
+
+# Slots with the same participants overlapping by more than this are duplicates
+DUPLICATE_OVERLAP_MINUTES = 15
+
+# Slot starts or profiles scanned between checks of a search's cancel flag
+CANCEL_CHECK_INTERVAL = 64
+
+# Seconds between cancel flag checks while waiting on a pool worker's date
+CANCEL_POLL_SECONDS = 0.05
+
+class SearchCancelled(Exception):
+    """Raised from a find_best_slots progress callback to stop the search"""
+
+def check_cancelled(cancelled: Optional[Callable[[], bool]]) -> None:
+    """Raise SearchCancelled if the search's cancel flag is set"""
+    if cancelled is not None and cancelled():
+        raise SearchCancelled()
 
 @dataclass
 class TimeSlot:
@@ -21,19 +61,23 @@ class TimeSlot:
     def overlaps_with(self, other: 'TimeSlot') -> bool:
         return self.start_time < other.end_time and self.end_time > other.start_time
 
-def convert_to_utc(local_time: time, tz_name: str, date: datetime.date) -> datetime:
+def convert_to_utc(local_time: time, tz_name: str, date: datetime.date, resolver: Optional[ZoneOffsetResolver] = None) -> datetime:
     """Convert local time to UTC for a specific date"""
-    local_dt = datetime.combine(date, local_time)
-    local_dt = local_dt.replace(tzinfo=ZoneInfo(tz_name))
-    return local_dt.astimezone(ZoneInfo("UTC"))
+    if resolver is None:
+        local_dt = datetime.combine(date, local_time).replace(tzinfo=ZoneInfo(tz_name))
+        return local_dt.astimezone(ZoneInfo("UTC"))
+    local_minute = date_to_minutes(date) + local_time.hour * 60 + local_time.minute
+    utc_dt = minutes_to_datetime(resolver.to_utc(tz_name, local_minute))
+    return utc_dt.replace(second=local_time.second, microsecond=local_time.microsecond, tzinfo=ZoneInfo("UTC"))
 
 def is_participant_available(participant: Participant, utc_time: datetime) -> bool:
     """Check if participant is available at a specific UTC time"""
     # Convert UTC time to participant's local time
     local_dt = utc_time.astimezone(ZoneInfo(participant.tz))
-    local_time = local_dt.time()
-    local_date = local_dt.date()
-    
+    return is_available_at_local(participant, local_dt.time(), local_dt.date())
+
+def is_available_at_local(participant: Participant, local_time: time, local_date: datetime.date) -> bool:
+    """Check if participant is available at a local wall-clock time"""
     # Check if within working hours
     if participant.end_time < participant.start_time:
         # Working hours span midnight (e.g., 22:00 to 06:00)
@@ -55,9 +99,10 @@ def is_participant_available(participant: Participant, utc_time: datetime) -> bo
     
     return True
 
-def get_availability_grid(participants: List[Participant], date: datetime.date, interval_minutes: int = 15) -> Dict[datetime, Set[str]]:
+def get_availability_grid(participants: List[Participant], date: datetime.date, interval_minutes: int = 15, profiles: Optional[List[AvailabilityProfile]] = None, tracer: Optional[Tracer] = None, cancelled: Optional[Callable[[], bool]] = None) -> Dict[datetime, Set[str]]:
     """Create availability grid for a specific date"""
     grid: Dict[datetime, Set[str]] = {}
+    profiles = profiles if profiles is not None else group_participants(participants)
     
     # Create 24-hour grid starting from midnight UTC
     day_start = datetime.combine(date, time(0, 0)).replace(tzinfo=ZoneInfo("UTC"))
@@ -65,96 +110,665 @@ def get_availability_grid(participants: List[Participant], date: datetime.date,
     # Generate time slots for the entire day
     num_slots = (24 * 60) // interval_minutes
     
-    print(f"Creating availability grid for {date} with {interval_minutes}-minute intervals")
-    print(f"Checking {len(participants)} participants: {[p.name for p in participants]}")
+    # Held here: ZoneInfo's own cache keeps only a few zones alive
+    zones = {participant.tz: ZoneInfo(participant.tz) for profile in profiles for participant in profile.participants}
     
     for i in range(num_slots):
+        # Each sample checks every profile, so a big roster checks every sample
+        check_cancelled(cancelled)
         slot_time = day_start + timedelta(minutes=i * interval_minutes)
         available_participants = set()
+        # Local (time, date) of this sample per zone, converted once
+        local_times: Dict[str, Tuple[time, datetime.date]] = {}
         
-        for participant in participants:
-            if is_participant_available(participant, slot_time):
-                available_participants.add(participant.name)
+        # Everyone in a profile shares availability, so check one of them
+        for profile in profiles:
+            for participant in profile.participants:
+                local = local_times.get(participant.tz)
+                if local is None:
+                    local_dt = slot_time.astimezone(zones[participant.tz])
+                    local = local_times[participant.tz] = (local_dt.time(), local_dt.date())
+                if is_available_at_local(participant, *local):
+                    available_participants.update(profile.names)
+                    break
         
         # Only add slots where at least one participant is available
         if available_participants:
             grid[slot_time] = available_participants
     
-    print(f"Found {len(grid)} time slots with available participants")
-    
-    # Show sample availability for debugging
-    if grid:
-        sorted_times = sorted(grid.keys())
-        print(f"Sample availability (first 5 slots):")
-        for slot_time in sorted_times[:5]:
-            available = grid[slot_time]
-            print(f"  {slot_time.strftime('%H:%M')} UTC: {', '.join(sorted(available))}")
+    if tracer is not None:
+        tracer.emit(TRACE_SUMMARY, "grid_built", date=date, interval_minutes=interval_minutes, slot_count=len(grid))
+        if tracer.wants(TRACE_DETAIL):
+            # Sample availability for debugging (first 5 slots)
+            for slot_time in sorted(grid)[:5]:
+                tracer.emit(TRACE_DETAIL, "grid_sample", time=slot_time, participants=grid[slot_time])
     
     return grid
 
-def find_continuous_slots(grid: Dict[datetime, Set[str]], min_duration_minutes: int, interval_minutes: int = 15) -> List[TimeSlot]:
+def find_maximal_runs(entries: List[Tuple[Any, Any, Any]], keep: Optional[Callable[[Any], bool]] = None, prefer: Optional[Callable[[Any], float]] = None, cancelled: Optional[Callable[[], bool]] = None) -> List[Tuple[Any, Any, Any]]:
+    """Find maximal (start, end, attendees) runs in a single pass
+
+    entries are (start, end, attendees) in time order, where attendees is a
+    set or a bitmask. From each start, a run extends over touching entries
+    while the attendees common to all of them pass keep (by default: while
+    someone is available in all of them); runs that merely repeat the
+    previous start's end and attendees (nested duplicates) are dropped.
+    keep must hold for any superset of a set it accepts.
+
+    prefer rates a start (e.g. by time of day). A nested duplicate is kept
+    after all when its start rates higher than every earlier start of the
+    run, since the shorter slot can then outscore the longer one.
+
+    cancelled is checked every CANCEL_CHECK_INTERVAL starts.
+
+    Both ends of the window only move forward, and the window's attendee
+    intersection is kept with a two-stack queue, so every entry is
+    intersected a constant number of times.
+    """
+    keep = keep or bool
+    runs: List[Tuple[Any, Any, Any]] = []
+    best_rating = None
+    front: List[Any] = []  # running intersections, window head on top
+    back: List[Any] = []   # entries pushed since the last transfer
+    back_common = None
+    j = 0
+
+    def window_common():
+        if not front:
+            return back_common
+        if back_common is None:
+            return front[-1]
+        return front[-1] & back_common
+
+    for i, (start, _, attendees) in enumerate(entries):
+        if i % CANCEL_CHECK_INTERVAL == 0:
+            check_cancelled(cancelled)
+        if not keep(attendees):
+            continue
+        if j <= i:
+            # Window is empty: start a new one at this entry
+            front, back, back_common, j = [], [attendees], attendees, i + 1
+
+        # Extend to the right while the intersection stays non-empty
+        common = window_common()
+        while j < len(entries) and entries[j][0] == entries[j - 1][1] and keep(common & entries[j][2]):
+            back.append(entries[j][2])
+            back_common = entries[j][2] if back_common is None else back_common & entries[j][2]
+            common = common & entries[j][2]
+            j += 1
+
+        end = entries[j - 1][1]
+        if not runs or runs[-1][1] != end or runs[-1][2] != common:
+            runs.append((start, end, common))
+            best_rating = prefer(start) if prefer is not None else None
+        elif prefer is not None and prefer(start) > best_rating:
+            runs.append((start, end, common))
+            best_rating = prefer(start)
+
+        # Drop entry i from the head of the window
+        if not front:
+            for value in reversed(back):
+                front.append(value if not front else value & front[-1])
+            back, back_common = [], None
+        front.pop()
+
+    return runs
+
+def find_continuous_slots(grid: Dict[datetime, Set[str]], min_duration_minutes: int, interval_minutes: int = 15, min_attendees: int = 1, cancelled: Optional[Callable[[], bool]] = None) -> List[TimeSlot]:
     """Find continuous time slots where participants are available"""
     slots: List[TimeSlot] = []
     sorted_times = sorted(grid.keys())
     
     if not sorted_times:
-        print("No available time slots in grid")
         return slots
     
     min_intervals = max(1, min_duration_minutes // interval_minutes)
-    print(f"Looking for continuous slots of at least {min_intervals} intervals ({min_duration_minutes} minutes)")
     
-    # Simple approach: find all continuous blocks
-    i = 0
-    while i < len(sorted_times):
-        start_time = sorted_times[i]
-        current_participants = grid[start_time].copy()
+    step = timedelta(minutes=interval_minutes)
+    entries = [(slot_time, slot_time + step, grid[slot_time]) for slot_time in sorted_times]
+    
+    keep = (lambda names: len(names) >= min_attendees) if min_attendees > 1 else None
+    prefer = lambda slot_time: get_time_of_day_score(slot_time.hour)
+    for start_time, end_time, current_participants in find_maximal_runs(entries, keep, prefer, cancelled):
+        if end_time - start_time < min_intervals * step:
+            continue
+        
+        slot = TimeSlot(
+            start_time=start_time,
+            end_time=end_time,
+            participant_count=len(current_participants),
+            participant_names=set(current_participants)
+        )
+        
+        slots.append(slot)
+    
+    return slots
+
+def expand_profile_mask(mask: int, profiles: List[AvailabilityProfile]) -> Set[str]:
+    """Names of everyone in the profiles selected by a mask"""
+    names: Set[str] = set()
+    for bit in iter_mask_bits(mask):
+        names.update(profiles[bit].names)
+    return names
+
+def get_attendee_quorum(profiles: List[AvailabilityProfile], min_attendees: int) -> Optional[Callable[[int], bool]]:
+    """Check that a profile mask covers at least min_attendees names (None if any will do)"""
+    if min_attendees <= 1:
+        return None
+    sizes = [profile.size for profile in profiles]
+    return lambda mask: sum(sizes[bit] for bit in iter_mask_bits(mask)) >= min_attendees
+
+def get_profile_masks(profiles: List[AvailabilityProfile], date: datetime.date, interval_minutes: int = 15, resolver: Optional[ZoneOffsetResolver] = None, cancelled: Optional[Callable[[], bool]] = None) -> List[int]:
+    """Build one day bitmask per profile (bit i = slot i of the UTC day)"""
+    resolver = resolver or default_resolver(date)
+    masks: List[int] = []
+    for index, profile in enumerate(profiles):
+        if index % CANCEL_CHECK_INTERVAL == 0:
+            check_cancelled(cancelled)
+        masks.append(intervals_to_mask(profile.get_utc_intervals(date, resolver), interval_minutes))
+    return masks
+
+def get_availability_masks(participants: List[Participant], date: datetime.date, interval_minutes: int = 15, resolver: Optional[ZoneOffsetResolver] = None, profiles: Optional[List[AvailabilityProfile]] = None, cancelled: Optional[Callable[[], bool]] = None) -> Tuple[List[int], List[AvailabilityProfile]]:
+    """Create bitset availability for a specific date
+
+    Returns one attendee mask per slot of the UTC day together with the
+    availability profiles the mask bits refer to.
+    """
+    num_slots = MINUTES_PER_DAY // interval_minutes
+    profiles = profiles if profiles is not None else group_participants(participants)
+    profile_masks = get_profile_masks(profiles, date, interval_minutes, resolver, cancelled)
+
+    # Transpose: toggle each profile's bit at the edges of its available runs
+    toggles = [0] * (num_slots + 1)
+    for index, day_mask in enumerate(profile_masks):
+        bit = 1 << index
+        for start, end in iter_mask_runs(day_mask):
+            toggles[start] ^= bit
+            toggles[end] ^= bit
+
+    slot_masks: List[int] = []
+    current = 0
+    for i in range(num_slots):
+        current ^= toggles[i]
+        slot_masks.append(current)
+
+    return slot_masks, profiles
+
+def find_continuous_mask_slots(slot_masks: List[int], profiles: List[AvailabilityProfile], date: datetime.date, min_duration_minutes: int, interval_minutes: int = 15, min_attendees: int = 1, cancelled: Optional[Callable[[], bool]] = None) -> List[TimeSlot]:
+    """Find continuous time slots from per-slot attendee masks"""
+    slots: List[TimeSlot] = []
+    day_start = datetime.combine(date, time(0, 0)).replace(tzinfo=ZoneInfo("UTC"))
+    min_intervals = max(1, min_duration_minutes // interval_minutes)
+
+    entries = [(i, i + 1, mask) for i, mask in enumerate(slot_masks) if mask]
+    prefer = lambda i: get_time_of_day_score(i * interval_minutes // 60)
+    for start, end, attendees in find_maximal_runs(entries, get_attendee_quorum(profiles, min_attendees), prefer, cancelled):
+        if end - start >= min_intervals:
+            participant_names = expand_profile_mask(attendees, profiles)
+            slots.append(TimeSlot(
+                start_time=day_start + timedelta(minutes=start * interval_minutes),
+                end_time=day_start + timedelta(minutes=end * interval_minutes),
+                participant_count=len(participant_names),
+                participant_names=participant_names
+            ))
+
+    return slots
+
+def get_attendance_segments(participants: List[Participant], date: datetime.date, resolver: Optional[ZoneOffsetResolver] = None, profiles: Optional[List[AvailabilityProfile]] = None, cancelled: Optional[Callable[[], bool]] = None) -> Tuple[List[Tuple[int, int, int]], List[AvailabilityProfile]]:
+    """Sweep participants' UTC intervals into constant-attendance segments
+
+    Returns (start_minute, end_minute, attendee_mask) tuples for a UTC date,
+    each maximal and at minute precision, plus the availability profiles the
+    mask bits refer to.
+    """
+    resolver = resolver or default_resolver(date)
+    profiles = profiles if profiles is not None else group_participants(participants)
+
+    # Toggle each profile's bit at both ends of its intervals
+    toggles: Dict[int, int] = {}
+    for index, profile in enumerate(profiles):
+        if index % CANCEL_CHECK_INTERVAL == 0:
+            check_cancelled(cancelled)
+        bit = 1 << index
+        for start, end in profile.get_utc_intervals(date, resolver):
+            toggles[start] = toggles.get(start, 0) ^ bit
+            toggles[end] = toggles.get(end, 0) ^ bit
+
+    segments: List[Tuple[int, int, int]] = []
+    current = 0
+    points = sorted(minute for minute, toggle in toggles.items() if toggle)
+    for minute, next_minute in zip(points, points[1:]):
+        current ^= toggles[minute]
+        if current:
+            segments.append((minute, next_minute, current))
+
+    return segments, profiles
+
+def find_continuous_segment_slots(segments: List[Tuple[int, int, int]], profiles: List[AvailabilityProfile], date: datetime.date, min_duration_minutes: int, interval_minutes: int = 15, min_attendees: int = 1, cancelled: Optional[Callable[[], bool]] = None) -> List[TimeSlot]:
+    """Find continuous time slots from attendance segments
+
+    Slot boundaries are aligned inward to multiples of interval_minutes, so
+    a slot never includes time where one of its attendees is unavailable.
+    """
+    slots: List[TimeSlot] = []
+    day_start = datetime.combine(date, time(0, 0)).replace(tzinfo=ZoneInfo("UTC"))
+    min_minutes = max(1, min_duration_minutes)
+
+    align = lambda minute: -(-minute // interval_minutes) * interval_minutes
+    prefer = lambda minute: get_time_of_day_score(align(minute) // 60)
+    for run_start, run_end, attendees in find_maximal_runs(segments, get_attendee_quorum(profiles, min_attendees), prefer, cancelled):
+        start = align(run_start)
+        end = (run_end // interval_minutes) * interval_minutes
+        if end - start >= min_minutes:
+            participant_names = expand_profile_mask(attendees, profiles)
+            slots.append(TimeSlot(
+                start_time=day_start + timedelta(minutes=start),
+                end_time=day_start + timedelta(minutes=end),
+                participant_count=len(participant_names),
+                participant_names=participant_names
+            ))
+
+    return slots
+
+def get_date_availability(participants: List[Participant], date: datetime.date, interval_minutes: int = 15, engine: str = "grid", resolver: Optional[ZoneOffsetResolver] = None, profiles: Optional[List[AvailabilityProfile]] = None, tracer: Optional[Tracer] = None, stats: Optional[SearchStats] = None, cancelled: Optional[Callable[[], bool]] = None) -> Any:
+    """Build the selected engine's availability for a single date
+
+    Returns the grid, slot masks or attendance segments, or None when nobody
+    is available. The result can be searched any number of times with
+    find_slots_in_availability, e.g. for several minimum durations.
+    """
+    resolver = resolver or default_resolver(date)
+    profiles = profiles if profiles is not None else group_participants(participants)
+    with timed_phase(stats, "availability"):
+        if engine == "sweep":
+            availability, _ = get_attendance_segments(participants, date, resolver, profiles, cancelled)
+        elif engine == "bitset":
+            availability, _ = get_availability_masks(participants, date, interval_minutes, resolver, profiles, cancelled)
+            if not any(availability):
+                availability = None
+        else:
+            availability = get_availability_grid(participants, date, interval_minutes, profiles, tracer, cancelled)
+
+    if stats is not None:
+        # Profiles are evaluated once per grid sample, or once per date from intervals
+        samples = MINUTES_PER_DAY // interval_minutes if engine == "grid" else 1
+        stats.availability_checks += samples * len(profiles)
+
+    if not availability:
+        if tracer is not None:
+            tracer.emit(TRACE_SUMMARY, "no_availability", date=date)
+        return None
+    return availability
+
+def find_slots_in_availability(availability: Any, profiles: List[AvailabilityProfile], date: datetime.date, min_duration: int, interval_minutes: int = 15, engine: str = "grid", min_attendees: int = 1, tracer: Optional[Tracer] = None, stats: Optional[SearchStats] = None, cancelled: Optional[Callable[[], bool]] = None) -> List[TimeSlot]:
+    """Find continuous slots in a date's availability from get_date_availability"""
+    if availability is None:
+        return []
+    with timed_phase(stats, "slots"):
+        if engine == "sweep":
+            slots = find_continuous_segment_slots(availability, profiles, date, min_duration, interval_minutes, min_attendees, cancelled)
+        elif engine == "bitset":
+            slots = find_continuous_mask_slots(availability, profiles, date, min_duration, interval_minutes, min_attendees, cancelled)
+        else:
+            slots = find_continuous_slots(availability, min_duration, interval_minutes, min_attendees, cancelled)
+
+    if tracer is not None and tracer.wants(TRACE_DETAIL):
+        for slot in slots:
+            tracer.emit(TRACE_DETAIL, "slot_found", date=date, start=slot.start_time, end=slot.end_time,
+                        participants=slot.participant_names)
+    return slots
+
+def find_slots_for_date(participants: List[Participant], date: datetime.date, min_duration: int, interval_minutes: int = 15, engine: str = "grid", resolver: Optional[ZoneOffsetResolver] = None, profiles: Optional[List[AvailabilityProfile]] = None, tracer: Optional[Tracer] = None, stats: Optional[SearchStats] = None, min_attendees: int = 1) -> List[TimeSlot]:
+    """Run the selected availability engine for a single date"""
+    profiles = profiles if profiles is not None else group_participants(participants)
+    availability = get_date_availability(participants, date, interval_minutes, engine, resolver, profiles, tracer, stats)
+    return find_slots_in_availability(availability, profiles, date, min_duration, interval_minutes, engine, min_attendees, tracer, stats)
+
+def get_time_of_day_score(hour: int) -> float:
+    """Time of day part of a slot's score, by its UTC start hour (business hours are best)"""
+    if 9 <= hour <= 17:
+        return 1.0
+    if 8 <= hour <= 18:
+        return 0.8
+    return 0.6
+
+def score_slot(slot: TimeSlot, max_participants: int, prioritize_participants: bool = True) -> float:
+    """Score a slot between 0 and 1"""
+    # Participant score (0-1)
+    participant_score = slot.participant_count / max_participants
+    
+    # Duration score (0-1, capped at 4 hours)
+    duration_hours = (slot.end_time - slot.start_time).total_seconds() / 3600
+    duration_score = min(duration_hours / 4.0, 1.0)
+    
+    # Day preference score (today is best, flat beyond the first week)
+    day_score = max(1.0 - (getattr(slot, 'day_offset', 0) / 7.0), 0.0)
+    
+    # Time of day score (prefer business hours)
+    time_score = get_time_of_day_score(slot.start_time.hour)
+    
+    # Calculate final score
+    if prioritize_participants:
+        return (participant_score * 0.5) + (duration_score * 0.2) + (day_score * 0.2) + (time_score * 0.1)
+    return (duration_score * 0.5) + (participant_score * 0.2) + (day_score * 0.2) + (time_score * 0.1)
+
+class DuplicateSlotIndex:
+    """Accepted slots indexed by attendee set, for fast duplicate checks
+
+    A slot duplicates an accepted one when both have the same participants
+    and overlap by more than DUPLICATE_OVERLAP_MINUTES. Each attendee set
+    keeps its accepted slots sorted by start, so a check only looks at the
+    few slots that start close enough to overlap.
+    """
+
+    def __init__(self):
+        self._starts: Dict[frozenset, List[datetime]] = {}
+        self._ends: Dict[frozenset, List[datetime]] = {}
+        self._longest: Dict[frozenset, timedelta] = {}
+
+    def is_duplicate(self, slot: TimeSlot) -> bool:
+        key = frozenset(slot.participant_names)
+        starts = self._starts.get(key)
+        if not starts:
+            return False
+        ends = self._ends[key]
         
-        if not current_participants:
-            i += 1
+        # Only slots starting in this window can overlap by more than the limit
+        min_overlap = timedelta(minutes=DUPLICATE_OVERLAP_MINUTES)
+        earliest = slot.start_time + min_overlap - self._longest[key]
+        k = bisect_left(starts, slot.end_time - min_overlap) - 1
+        while k >= 0 and starts[k] > earliest:
+            overlap = min(slot.end_time, ends[k]) - max(slot.start_time, starts[k])
+            if overlap > min_overlap:
+                return True
+            k -= 1
+        return False
+
+    def add(self, slot: TimeSlot) -> None:
+        key = frozenset(slot.participant_names)
+        starts = self._starts.setdefault(key, [])
+        k = bisect_right(starts, slot.start_time)
+        starts.insert(k, slot.start_time)
+        self._ends.setdefault(key, []).insert(k, slot.end_time)
+        self._longest[key] = max(self._longest.get(key, timedelta(0)), slot.end_time - slot.start_time)
+
+def select_top_slots(slots: List[TimeSlot], top_k: int = 3, stats: Optional[SearchStats] = None) -> List[TimeSlot]:
+    """Pick the best-scoring slots, skipping duplicates
+
+    Slots are taken in order of score (ties keep their original order).
+    With top_k > 0 a heap yields slots lazily, so only as many are ordered
+    as it takes to collect top_k unique ones; top_k <= 0 returns them all.
+    """
+    index = DuplicateSlotIndex()
+    unique_slots: List[TimeSlot] = []
+    
+    if top_k > 0:
+        heap = [(-slot.score, i) for i, slot in enumerate(slots)]
+        heapq.heapify(heap)
+        ordered = (slots[heapq.heappop(heap)[1]] for _ in range(len(heap)))
+    else:
+        ordered = iter(sorted(slots, key=lambda x: x.score, reverse=True))
+    
+    for slot in ordered:
+        if index.is_duplicate(slot):
+            if stats is not None:
+                stats.duplicate_slots += 1
             continue
+        index.add(slot)
+        unique_slots.append(slot)
+        if 0 < top_k <= len(unique_slots):
+            break
+    
+    return unique_slots
+
+def process_date_ladder(participants: List[Participant], date: datetime.date, ladder: List[Tuple[int, int]], interval_minutes: int, engine: str, resolver: ZoneOffsetResolver, profiles: List[AvailabilityProfile], tracer: Optional[Tracer] = None, stats: Optional[SearchStats] = None, cancelled: Optional[Callable[[], bool]] = None) -> List[List[TimeSlot]]:
+    """Find slots for one date of a search at every (min_duration, min_attendees) rung
+
+    The date's availability is built once and searched for each rung.
+    """
+    if tracer is not None and tracer.wants(TRACE_DETAIL):
+        # Participant working hours for this date, local and UTC
+        for participant in participants:
+            tracer.emit(
+                TRACE_DETAIL, "working_hours", date=date, name=participant.name, tz=participant.tz,
+                start=participant.start_time, end=participant.end_time,
+                utc_start=convert_to_utc(participant.start_time, participant.tz, date, resolver),
+                utc_end=convert_to_utc(participant.end_time, participant.tz, date, resolver)
+            )
+    
+    availability = get_date_availability(participants, date, interval_minutes, engine, resolver, profiles, tracer, stats, cancelled)
+    return [
+        find_slots_in_availability(availability, profiles, date, min_duration, interval_minutes, engine, min_attendees, tracer, stats, cancelled)
+        for min_duration, min_attendees in ladder
+    ]
+
+def process_date(participants: List[Participant], date: datetime.date, min_duration: int, interval_minutes: int, engine: str, resolver: ZoneOffsetResolver, profiles: List[AvailabilityProfile], tracer: Optional[Tracer] = None, stats: Optional[SearchStats] = None) -> List[TimeSlot]:
+    """Find slots for one date of a search"""
+    return process_date_ladder(participants, date, [(min_duration, 1)], interval_minutes, engine, resolver, profiles, tracer, stats)[0]
+
+def process_date_job(participants: List[Participant], date: datetime.date, ladder: List[Tuple[int, int]], interval_minutes: int, engine: str, resolver: ZoneOffsetResolver, profiles: List[AvailabilityProfile], trace_level: int = 0, collect_stats: bool = False, cancelled: Optional[Callable[[], bool]] = None) -> Tuple[List[List[TimeSlot]], List[Tuple[str, Dict[str, Any]]], Optional[SearchStats]]:
+    """Process pool entry point: find one date's slots per rung with its trace events and stats
+
+    Sinks and shared stats cannot cross a process boundary, so both are
+    recorded in the worker and handed back to the parent, which replays and
+    merges them in date order.
+    """
+    events: List[Tuple[str, Dict[str, Any]]] = []
+    tracer = Tracer(lambda event, fields: events.append((event, fields)), trace_level) if trace_level else None
+    stats = SearchStats() if collect_stats else None
+    rungs = process_date_ladder(participants, date, ladder, interval_minutes, engine, resolver, profiles, tracer, stats, cancelled)
+    return rungs, events, stats
+
+# Search each date pool worker runs, sent once by _init_date_worker
+_worker_search: Optional[Tuple[Any, ...]] = None
+
+def _init_date_worker(*search: Any) -> None:
+    global _worker_search
+    _worker_search = search
+
+def process_worker_date(date: datetime.date, ladder: List[Tuple[int, int]]) -> Tuple[List[List[TimeSlot]], List[Tuple[str, Dict[str, Any]]], Optional[SearchStats]]:
+    """Process pool entry point: process_date_job for the search this worker was started with"""
+    participants, *args = _worker_search
+    return process_date_job(participants, date, ladder, *args)
+
+def create_date_pool(workers: int, participants: List[Participant], interval_minutes: int, engine: str, resolver: ZoneOffsetResolver, profiles: List[AvailabilityProfile], tracer: Optional[Tracer] = None, stats: Optional[SearchStats] = None) -> 'Executor':
+    """Process pool for iter_date_ladder_slots over this search
+
+    The roster, zone tables and profiles go to each worker once when it
+    starts, so each submitted job carries only its date and rungs.
+    """
+    from concurrent.futures import ProcessPoolExecutor
+    search = (participants, interval_minutes, engine, resolver, profiles,
+              tracer.level if tracer is not None else 0, stats is not None)
+    return ProcessPoolExecutor(max_workers=workers, initializer=_init_date_worker, initargs=search)
+
+def wait_for_date_job(future: 'Future', cancelled: Optional[Callable[[], bool]] = None) -> Any:
+    """Result of a pool worker's date, checking the cancel flag while it runs"""
+    if cancelled is not None:
+        from concurrent.futures import wait
+        while not wait([future], timeout=CANCEL_POLL_SECONDS).done:
+            check_cancelled(cancelled)
+    return future.result()
+
+def iter_date_ladder_slots(
+    participants: List[Participant],
+    dates_to_check: List[datetime.date],
+    ladder: List[Tuple[int, int]],
+    interval_minutes: int = 15,
+    engine: str = "grid",
+    resolver: Optional[ZoneOffsetResolver] = None,
+    profiles: Optional[List[AvailabilityProfile]] = None,
+    executor: Optional['Executor'] = None,
+    max_pending: int = 1,
+    tracer: Optional[Tracer] = None,
+    stats: Optional[SearchStats] = None,
+    cancelled: Optional[Callable[[], bool]] = None
+) -> Iterator[Tuple[datetime.date, List[List[TimeSlot]]]]:
+    """Yield (date, slots per rung) one date at a time, in date order
+
+    ladder lists (min_duration, min_attendees) rungs from strictest to most
+    relaxed, and each date's availability is built once for all of them.
+    Only the strictest rung that produced any slot matters to a search, so
+    once a rung has slots, the rungs after it are no longer evaluated and
+    come back empty.
+
+    Slots are tagged with their day_offset. An executor must come from
+    create_date_pool with the same search arguments. With one, up to
+    max_pending dates are in flight at once and results are still yielded
+    in date order, so memory stays bounded on long horizons and the output
+    does not depend on completion order. A date that fails is logged and
+    yields no slots.
+
+    cancelled is polled during each date, in this process or while waiting
+    on a worker, and SearchCancelled is raised once it returns true.
+    """
+    if not dates_to_check:
+        return
+    resolver = resolver or ZoneOffsetResolver(dates_to_check[0], dates_to_check[-1])
+    profiles = profiles if profiles is not None else group_participants(participants)
+    args = (interval_minutes, engine, resolver, profiles,
+            tracer.level if tracer is not None else 0, stats is not None)
+    depth = len(ladder)
+    
+    pending: Deque = deque()
+    dates = iter(enumerate(dates_to_check))
+    while True:
+        # Keep the pool busy without queueing the whole horizon
+        while executor is not None and len(pending) < max_pending:
+            next_date = next(dates, None)
+            if next_date is None:
+                break
+            i, date = next_date
+            future = executor.submit(process_worker_date, date, ladder[:depth])
+            pending.append((i, date, partial(wait_for_date_job, future, cancelled)))
+        
+        if pending:
+            i, date, get_rungs = pending.popleft()
+        else:
+            next_date = next(dates, None)
+            if next_date is None:
+                return
+            i, date = next_date
+            get_rungs = partial(process_date_job, participants, date, ladder[:depth], *args, cancelled=cancelled)
+        
+        if tracer is not None:
+            tracer.emit(TRACE_SUMMARY, "date_started", date=date, day_offset=i)
+        try:
+            rungs, events, date_stats = get_rungs()
+        except SearchCancelled:
+            raise
+        except Exception as e:
+            logger.warning("Error processing %s: %s", date, e, exc_info=True)
+            if tracer is not None:
+                tracer.emit(TRACE_SUMMARY, "date_failed", date=date, error=e)
+            rungs, events, date_stats = [], [], None
+        rungs = (rungs + [[] for _ in ladder])[:len(ladder)]
         
-        # Extend the slot as far as possible
-        j = i
-        while j < len(sorted_times):
-            current_time = sorted_times[j]
-            
-            # Check if this time slot has overlapping participants
-            slot_participants = grid[current_time]
-            common_participants = current_participants & slot_participants
-            
-            if not common_participants:
+        if stats is not None:
+            stats.dates_searched += 1
+            if date_stats is not None:
+                stats.merge(date_stats)
+        
+        # Add day offset for scoring
+        for slots in rungs:
+            for slot in slots:
+                slot.day_offset = i
+        
+        # Later rungs cannot win once this one has slots
+        for rung, slots in enumerate(rungs[:depth]):
+            if slots:
+                depth = rung + 1
                 break
-            
-            # Check if times are continuous
-            if j > i:
-                expected_time = sorted_times[j-1] + timedelta(minutes=interval_minutes)
-                if current_time != expected_time:
-                    break
-            
-            current_participants = common_participants
-            j += 1
         
-        # Check if we have a valid slot
-        duration_intervals = j - i
-        if duration_intervals >= min_intervals and current_participants:
-            end_time = sorted_times[j-1] + timedelta(minutes=interval_minutes)
-            
-            slot = TimeSlot(
-                start_time=start_time,
-                end_time=end_time,
-                participant_count=len(current_participants),
-                participant_names=current_participants.copy()
-            )
-            
-            slots.append(slot)
-            print(f"Found slot: {slot.start_time.strftime('%H:%M')}-{slot.end_time.strftime('%H:%M')} "
-                  f"with {len(current_participants)} participants: {', '.join(sorted(current_participants))}")
+        if tracer is not None:
+            for event, fields in events:
+                tracer.sink(event, fields)
+            tracer.emit(TRACE_SUMMARY, "date_finished", date=date, slot_count=sum(len(slots) for slots in rungs))
+        yield date, rungs
+
+def iter_date_slots(
+    participants: List[Participant],
+    dates_to_check: List[datetime.date],
+    min_duration: int,
+    interval_minutes: int = 15,
+    engine: str = "grid",
+    resolver: Optional[ZoneOffsetResolver] = None,
+    profiles: Optional[List[AvailabilityProfile]] = None,
+    executor: Optional['Executor'] = None,
+    max_pending: int = 1,
+    tracer: Optional[Tracer] = None,
+    stats: Optional[SearchStats] = None
+) -> Iterator[Tuple[datetime.date, List[TimeSlot]]]:
+    """Yield (date, slots) one date at a time, in date order (see iter_date_ladder_slots)"""
+    for date, rungs in iter_date_ladder_slots(participants, dates_to_check, [(min_duration, 1)], interval_minutes,
+                                              engine, resolver, profiles, executor, max_pending, tracer, stats):
+        yield date, rungs[0]
+
+def iter_candidate_slots(
+    participants: List[Participant],
+    min_duration: int,
+    start_date: Optional[datetime.date] = None,
+    horizon_days: int = 1,
+    engine: str = "grid",
+    interval_minutes: int = 15
+) -> Iterator[TimeSlot]:
+    """Yield unscored candidate slots day by day over a search horizon"""
+    today = start_date or datetime.now().date()
+    dates_to_check = [today + timedelta(days=i) for i in range(horizon_days)]
+    for _, slots in iter_date_slots(participants, dates_to_check, min_duration, interval_minutes, engine):
+        yield from slots
+
+class TopSlotCollector:
+    """Best-so-far unique slots over candidates streamed one date at a time
+
+    Slots never cross a UTC date, so duplicates (same participants,
+    overlapping) only occur within a date. Deduplicating each date on its
+    own and keeping the best top_k across dates in a bounded heap gives the
+    same result as ranking every candidate at once.
+    """
+
+    def __init__(self, top_k: int = 3, stats: Optional[SearchStats] = None):
+        self.top_k = top_k
+        self.stats = stats
+        self.candidate_count = 0
+        self._heap: List[Tuple[float, int, TimeSlot]] = []
+
+    def add_date(self, slots: List[TimeSlot]) -> None:
+        """Add one date's scored slots, in the order they were generated"""
+        sequence = {id(slot): self.candidate_count + i for i, slot in enumerate(slots)}
+        self.candidate_count += len(slots)
+        if self.stats is not None:
+            self.stats.candidate_slots += len(slots)
+            self.stats.peak_candidates = max(self.stats.peak_candidates, len(slots) + len(self._heap))
         
-        i += 1
-    
-    print(f"Found {len(slots)} continuous slots")
-    return slots
+        for slot in select_top_slots(slots, self.top_k, self.stats):
+            # Lower score, then later generation, is evicted first
+            entry = (slot.score, -sequence[id(slot)], slot)
+            if self.top_k <= 0 or len(self._heap) < self.top_k:
+                heapq.heappush(self._heap, entry)
+            elif entry[:2] > self._heap[0][:2]:
+                heapq.heapreplace(self._heap, entry)
+
+    def results(self) -> List[TimeSlot]:
+        """Unique slots, best first"""
+        return [slot for _, _, slot in sorted(self._heap, key=lambda entry: entry[:2], reverse=True)]
+
+def get_search_dates(start_date: Optional[datetime.date] = None, show_week: bool = False,
+                     horizon_days: Optional[int] = None) -> List[datetime.date]:
+    """Dates find_best_slots searches: horizon_days, else a week or a single day from start_date (today)"""
+    today = start_date or datetime.now().date()
+    if horizon_days is None:
+        horizon_days = 7 if show_week else 1
+    return [today + timedelta(days=i) for i in range(horizon_days)]
+
+def get_search_ladder(min_duration: int, quorum: Optional[int], everyone: int) -> List[Tuple[int, int]]:
+    """Relaxation ladder of (min_duration, min_attendees), strictest first: shorter meetings, then a quorum"""
+    ladder: List[Tuple[int, int]] = []
+    for min_attendees in ((1,) if quorum is None else (everyone, min(quorum, everyone))):
+        for duration in (min_duration, FALLBACK_DURATION_MINUTES):
+            if (duration, min_attendees) not in ladder:
+                ladder.append((duration, min_attendees))
+    return ladder
 
 def find_best_slots(
     participants: List[Participant],
@@ -162,153 +776,217 @@ def find_best_slots(
     show_week: bool = False,
     top_k: int = 3,
     start_date: Optional[datetime.date] = None,
-    prioritize_participants: bool = True
+    prioritize_participants: bool = True,
+    engine: str = "grid",
+    interval_minutes: int = 15,
+    workers: int = 1,
+    horizon_days: Optional[int] = None,
+    tracer: Optional[Tracer] = None,
+    stats: Optional[SearchStats] = None,
+    cache: Optional[SlotCache] = None,
+    quorum: Optional[int] = None,
+    resolver: Optional[ZoneOffsetResolver] = None,
+    profiles: Optional[List[AvailabilityProfile]] = None,
+    progress: Optional[Callable[[int, int], None]] = None,
+    interim: Optional[Callable[[List[TimeSlot]], None]] = None,
+    cancelled: Optional[Callable[[], bool]] = None
 ) -> List[TimeSlot]:
-    """Find best meeting slots"""
+    """Find best meeting slots
+
+    engine selects how availability is computed: "grid" samples every
+    participant at every slot, "bitset" builds per-participant day masks
+    from interval arithmetic and returns the same slots as "grid". "sweep"
+    works on exact interval endpoints and aligns slot boundaries to
+    interval_minutes instead of sampling at that resolution.
+
+    horizon_days searches that many days from the start date (overriding
+    show_week). Dates are streamed and only the best top_k survive each
+    one, so memory does not grow with the horizon.
+
+    workers > 1 spreads the dates over a process pool of that size
+    (0 uses one worker per CPU); results are identical to a serial run.
+
+    The search itself is silent; pass a Tracer to receive structured
+    progress events, and a SearchStats to have it filled with per-phase
+    timings and slot counts (see meet_zone.tracing).
+
+    With a SlotCache, the candidate slots are memoized per roster
+    fingerprint, min_duration, date range, interval and engine; a repeat
+    search that only changes top_k or prioritize_participants re-ranks them.
+
+    When nothing meets min_duration, slots of FALLBACK_DURATION_MINUTES are
+    returned instead. With a quorum, slots must first include everyone, then
+    at least quorum people, each at both durations. All rungs of this ladder
+    are searched from the same per-date availability in a single pass.
+
+    resolver and profiles (from group_participants over these participants)
+    can be passed in to reuse zone tables and compiled availability across
+    searches; the resolver is extended to cover the dates if needed.
+
+    progress is called with (dates done, dates total) after each date. It
+    runs on the searching thread and may raise SearchCancelled, which stops
+    the search (and any pool) and propagates to the caller. cancelled, if
+    given, is also polled within each date (every grid sample, and every
+    CANCEL_CHECK_INTERVAL profiles or slot starts) and raises
+    SearchCancelled once true, so a single long date can be stopped too.
+
+    interim is called with the best-so-far top_k (best first) whenever a
+    date changes it, from the strictest rung with candidates so far; the
+    return value is final. Slots passed to it must not be modified.
+    """
+    if engine not in ENGINES:
+        raise ValueError(f"Unknown engine '{engine}'. Choose from: {', '.join(ENGINES)}")
+    if interval_minutes <= 0:
+        raise ValueError("interval_minutes must be positive")
+    if workers < 0:
+        raise ValueError("workers must be 0 (one per CPU) or a positive count")
+    if horizon_days is not None and horizon_days <= 0:
+        raise ValueError("horizon_days must be positive")
+    if quorum is not None and quorum <= 0:
+        raise ValueError("quorum must be positive")
+    
+    started = perf_counter()
+    if tracer is not None:
+        tracer.emit(TRACE_SUMMARY, "search_started", participants=len(participants), min_duration=min_duration,
+                    show_week=show_week, top_k=top_k, prioritize_participants=prioritize_participants,
+                    engine=engine, interval_minutes=interval_minutes)
     
-    print(f"\n=== FINDING MEETING SLOTS ===")
-    print(f"Participants: {len(participants)}")
-    print(f"Min duration: {min_duration} minutes")
-    print(f"Show week: {show_week}")
-    print(f"Top results: {top_k}")
-    print(f"Prioritize participants: {prioritize_participants}")
+    # A zone ZoneInfo cannot load would fail every date; leave those people out
+    unknown_zones = sorted({participant.tz for participant in participants if not is_known_timezone(participant.tz)})
+    if unknown_zones:
+        logger.warning("Skipping participants in unknown timezones: %s", ", ".join(unknown_zones))
+        if tracer is not None:
+            tracer.emit(TRACE_SUMMARY, "unknown_timezones", timezones=unknown_zones)
+        participants = [participant for participant in participants if participant.tz not in unknown_zones]
+        profiles = None  # any passed in were grouped with them
     
     if not participants:
-        print("No participants provided")
         return []
     
-    today = start_date or datetime.now().date()
-    all_slots = []
-    interval_minutes = 15
-    
-    # Determine dates to check
-    dates_to_check = []
-    if show_week:
-        dates_to_check = [today + timedelta(days=i) for i in range(7)]
-    else:
-        dates_to_check = [today]
+    dates_to_check = get_search_dates(start_date, show_week, horizon_days)
+    max_participants = len(participants)
     
-    print(f"Checking dates: {[d.strftime('%Y-%m-%d') for d in dates_to_check]}")
+    everyone = len({participant.name for participant in participants})
+    ladder = get_search_ladder(min_duration, quorum, everyone)
     
-    # Process each date
-    for i, date in enumerate(dates_to_check):
-        print(f"\n--- Processing {date} ---")
-        
-        try:
-            # Show participant working hours for this date
-            print("Participant working hours (in their local timezone):")
-            for participant in participants:
-                print(f"  {participant.name} ({participant.tz}): {participant.start_time.strftime('%H:%M')}-{participant.end_time.strftime('%H:%M')}")
-                
-                # Show UTC equivalent
-                start_utc = convert_to_utc(participant.start_time, participant.tz, date)
-                end_utc = convert_to_utc(participant.end_time, participant.tz, date)
-                print(f"    UTC equivalent: {start_utc.strftime('%H:%M')}-{end_utc.strftime('%H:%M')}")
-            
-            # Get availability grid
-            grid = get_availability_grid(participants, date, interval_minutes)
-            
-            if not grid:
-                print(f"No availability found for {date}")
-                continue
-            
-            # Find continuous slots
-            slots = find_continuous_slots(grid, min_duration, interval_minutes)
-            
-            # Add day offset for scoring
+    def score(slots: List[TimeSlot]) -> None:
+        with timed_phase(stats, "scoring"):
             for slot in slots:
-                slot.day_offset = i
-            
-            all_slots.extend(slots)
-            print(f"Added {len(slots)} slots for {date}")
-            
-        except Exception as e:
-            print(f"Error processing {date}: {e}")
-            import traceback
-            traceback.print_exc()
-            continue
+                slot.score = score_slot(slot, max_participants, prioritize_participants)
     
-    print(f"\n=== TOTAL SLOTS FOUND: {len(all_slots)} ===")
+    def rank(collector: TopSlotCollector, slots: List[TimeSlot]) -> None:
+        # Rank by score (highest first) and remove duplicates and overlapping slots
+        with timed_phase(stats, "dedup"):
+            collector.add_date(slots)
     
-    if not all_slots:
-        print("No meeting slots found. Trying fallback strategies...")
-        
-        # Fallback 1: Try with shorter duration
-        print("Trying with 15-minute minimum duration...")
-        for i, date in enumerate(dates_to_check):
-            try:
-                grid = get_availability_grid(participants, date, interval_minutes)
-                if grid:
-                    shorter_slots = find_continuous_slots(grid, 15, interval_minutes)
-                    for slot in shorter_slots:
-                        slot.day_offset = i
-                    all_slots.extend(shorter_slots)
-                    print(f"Fallback found {len(shorter_slots)} slots for {date}")
-            except Exception as e:
-                print(f"Fallback error for {date}: {e}")
-        
-        if not all_slots:
-            print("Still no slots found. This suggests no overlapping availability.")
+    def new_collector() -> TopSlotCollector:
+        # Slot counts are kept per rung; only the winning rung's reach stats
+        return TopSlotCollector(top_k, SearchStats() if stats is not None else None)
+    
+    def finish(rung: int, collector: TopSlotCollector) -> List[TimeSlot]:
+        if stats is not None:
+            stats.merge_slot_counts(collector.stats)
+            stats.fallback_used = rung > 0
+            stats.total_seconds = perf_counter() - started
+        if not collector.candidate_count:
+            # No overlapping availability at all
+            if tracer is not None:
+                tracer.emit(TRACE_SUMMARY, "no_slots")
             return []
+        if rung > 0 and tracer is not None:
+            tracer.emit(TRACE_SUMMARY, "fallback_used", min_duration=ladder[rung][0], min_attendees=ladder[rung][1])
+        
+        unique_slots = collector.results()
+        if cache is not None:
+            # Callers may modify results; cached candidates must stay as scored
+            unique_slots = [replace(slot) for slot in unique_slots]
+        if tracer is not None:
+            tracer.emit(TRACE_SUMMARY, "search_finished", candidate_count=collector.candidate_count,
+                        slots=unique_slots)
+        return unique_slots
     
-    # Calculate scores
-    max_participants = len(participants)
+    # Candidates depend on the roster and search window, not on top_k or priority
+    cache_key = None
+    if cache is not None:
+        cache_key = (get_roster_fingerprint(participants), min_duration, quorum, dates_to_check[0],
+                     len(dates_to_check), interval_minutes, engine)
+        cached = cache.get(cache_key)
+        if cached is not None:
+            rung, date_batches = cached
+            if tracer is not None:
+                tracer.emit(TRACE_SUMMARY, "cache_hit", date_count=len(date_batches))
+            if stats is not None:
+                stats.cache_hit = True
+            collector = new_collector()
+            for done, slots in enumerate(date_batches, 1):
+                check_cancelled(cancelled)
+                # Cached slots are shared with concurrent searches; score copies
+                slots = [replace(slot) for slot in slots]
+                score(slots)
+                rank(collector, slots)
+                if progress is not None:
+                    progress(done, len(date_batches))
+            return finish(rung, collector)
     
-    for slot in all_slots:
-        # Participant score (0-1)
-        participant_score = slot.participant_count / max_participants
-        
-        # Duration score (0-1, capped at 4 hours)
-        duration_hours = (slot.end_time - slot.start_time).total_seconds() / 3600
-        duration_score = min(duration_hours / 4.0, 1.0)
-        
-        # Day preference score (today is best)
-        day_score = 1.0 - (getattr(slot, 'day_offset', 0) / 7.0)
-        
-        # Time of day score (prefer business hours)
-        hour = slot.start_time.hour
-        if 9 <= hour <= 17:
-            time_score = 1.0
-        elif 8 <= hour <= 18:
-            time_score = 0.8
+    # One offset table per zone for the whole search horizon
+    with timed_phase(stats, "zones"):
+        if resolver is None:
+            resolver = ZoneOffsetResolver(dates_to_check[0], dates_to_check[-1])
         else:
-            time_score = 0.6
-        
-        # Calculate final score
-        if prioritize_participants:
-            slot.score = (participant_score * 0.5) + (duration_score * 0.2) + (day_score * 0.2) + (time_score * 0.1)
-        else:
-            slot.score = (duration_score * 0.5) + (participant_score * 0.2) + (day_score * 0.2) + (time_score * 0.1)
-    
-    # Sort by score (highest first)
-    all_slots.sort(key=lambda x: x.score, reverse=True)
-    
-    # Remove duplicates and overlapping slots
-    unique_slots = []
-    for slot in all_slots:
-        is_duplicate = False
-        for unique_slot in unique_slots:
-            # Check for significant overlap with same participants
-            overlap_start = max(slot.start_time, unique_slot.start_time)
-            overlap_end = min(slot.end_time, unique_slot.end_time)
-            overlap_minutes = max(0, (overlap_end - overlap_start).total_seconds() / 60)
-            
-            if (overlap_minutes > 15 and slot.participant_names == unique_slot.participant_names):
-                is_duplicate = True
-                break
-        
-        if not is_duplicate:
-            unique_slots.append(slot)
-            if 0 < top_k <= len(unique_slots):
-                break
+            resolver.extend(dates_to_check[0], dates_to_check[-1])
+        resolver.prepare({participant.tz for participant in participants})
+    
+    # Participants with identical availability are scheduled once
+    if profiles is None:
+        profiles = group_participants(participants)
+    if tracer is not None:
+        tracer.emit(TRACE_SUMMARY, "profiles_grouped", start_date=dates_to_check[0], end_date=dates_to_check[-1],
+                    date_count=len(dates_to_check), profile_count=len(profiles))
     
-    print(f"\n=== FINAL RESULTS: {len(unique_slots)} unique slots ===")
-    for i, slot in enumerate(unique_slots, 1):
-        print(f"{i}. {slot.start_time.strftime('%Y-%m-%d %H:%M')}-{slot.end_time.strftime('%H:%M')} UTC")
-        print(f"   Participants ({slot.participant_count}): {', '.join(sorted(slot.participant_names))}")
-        print(f"   Score: {slot.score:.1%}")
+    pool_size = min(workers or os.cpu_count() or 1, len(dates_to_check))
+    executor = None
+    if pool_size > 1:
+        executor = create_date_pool(pool_size, participants, interval_minutes, engine, resolver, profiles, tracer, stats)
+    
+    # One collector per rung; each date's availability is built once for all of them
+    collectors = [new_collector() for _ in ladder]
+    rung_batches: List[List[List[TimeSlot]]] = [[] for _ in ladder]
+    shown: List[int] = []
+    try:
+        date_slots = iter_date_ladder_slots(participants, dates_to_check, ladder, interval_minutes, engine,
+                                            resolver, profiles, executor, 2 * pool_size, tracer, stats, cancelled)
+        for done, (_, rungs) in enumerate(date_slots, 1):
+            for collector, batches, slots in zip(collectors, rung_batches, rungs):
+                score(slots)
+                rank(collector, slots)
+                # Keep the candidates for the cache
+                if cache is not None:
+                    batches.append(slots)
+            if interim is not None:
+                leader = next((collector for collector in collectors if collector.candidate_count), None)
+                best = leader.results() if leader is not None else []
+                if [id(slot) for slot in best] != shown:
+                    shown = [id(slot) for slot in best]
+                    interim(best)
+            if progress is not None:
+                progress(done, len(dates_to_check))
+    except SearchCancelled:
+        if executor is not None:
+            # Do not wait for dates the workers are still on
+            executor.shutdown(wait=False, cancel_futures=True)
+            executor = None
+        raise
+    finally:
+        if executor is not None:
+            executor.shutdown(cancel_futures=True)
     
-    return unique_slots if top_k <= 0 else unique_slots[:top_k]
+    # The strictest rung with any candidate wins
+    rung = next((i for i, collector in enumerate(collectors) if collector.candidate_count), len(ladder) - 1)
+    unique_slots = finish(rung, collectors[rung])
+    if cache is not None:
+        # Only shared once this search is done with them
+        cache.put(cache_key, (rung, rung_batches[rung]))
+    return unique_slots
 
 def get_participant_busy_summary(participant: Participant, date: datetime.date) -> List[str]:
     """Get a summary of participant's busy slots for a specific date"""
@@ -0,0 +1,246 @@
+"""
+Scheduling daemon: a warm roster answering JSON requests on localhost
+
+Run with `meet-zone serve --roster ROSTER [--port 8765]`. The roster is parsed
+once and kept in a RosterSession; requests are served concurrently, one
+thread each, and only ever on 127.0.0.1.
+
+    GET    /health                         roster size and cache counters
+    GET    /participants                   the roster
+    PUT    /participants/NAME              add or replace a participant
+    DELETE /participants/NAME              remove a participant
+    POST   /participants/NAME/busy         add a busy slot
+    DELETE /participants/NAME/busy/INDEX   remove a busy slot by position
+    POST   /search                         a search request as in batch mode
+
+Participants are {"timezone", "start_time", "end_time", "busy_slots"} and
+busy slots {"start_time", "end_time", "date", "weekly", "description"}, with
+times as HH:MM and dates as YYYY-MM-DD. Errors reply {"error": message}
+with status 400, or 404 for an unknown participant or busy slot.
+"""
+
+import argparse
+import json
+import logging
+import sys
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import unquote
+
+from meet_zone.batch import load_session
+from meet_zone.parser import BusySlot, Participant, parse_date, parse_time
+from meet_zone.session import RosterSession
+
+DEFAULT_PORT = 8765
+
+logger = logging.getLogger(__name__)
+
+
+def busy_slot_to_dict(busy_slot: BusySlot) -> Dict[str, Any]:
+    return {
+        "start_time": busy_slot.start_time.strftime('%H:%M'),
+        "end_time": busy_slot.end_time.strftime('%H:%M'),
+        "date": busy_slot.date.isoformat() if busy_slot.date else None,
+        "weekly": busy_slot.recurring,
+        "description": busy_slot.description
+    }
+
+
+def check_string_fields(data: Dict[str, Any], fields: Tuple[str, ...]) -> None:
+    """ValueError unless each of these fields is a string or absent/null"""
+    for field_name in fields:
+        value = data.get(field_name)
+        if value is not None and not isinstance(value, str):
+            raise ValueError(f"{field_name} must be a string")
+
+
+def busy_slot_from_dict(data: Dict[str, Any]) -> BusySlot:
+    """Busy slot from its JSON fields; a weekly slot repeats on its date's weekday"""
+    if not isinstance(data, dict):
+        raise ValueError("A busy slot must be a JSON object")
+    check_string_fields(data, ("start_time", "end_time", "date", "description"))
+    busy_date = parse_date(data.get("date") or "")
+    if data.get("weekly") and busy_date is None:
+        raise ValueError("A weekly busy slot needs a date")
+    return BusySlot(
+        start_time=parse_time(data["start_time"]),
+        end_time=parse_time(data["end_time"]),
+        date=busy_date,
+        description=data.get("description", ""),
+        recurring=bool(data.get("weekly"))
+    )
+
+
+def participant_to_dict(participant: Participant) -> Dict[str, Any]:
+    return {
+        "name": participant.name,
+        "timezone": participant.tz,
+        "start_time": participant.start_time.strftime('%H:%M'),
+        "end_time": participant.end_time.strftime('%H:%M'),
+        "busy_slots": [busy_slot_to_dict(busy_slot) for busy_slot in participant.busy_slots]
+    }
+
+
+def participant_from_dict(name: str, data: Dict[str, Any]) -> Participant:
+    check_string_fields(data, ("timezone", "start_time", "end_time"))
+    busy_slots = data.get("busy_slots") or []
+    if not isinstance(busy_slots, list):
+        raise ValueError("busy_slots must be a list")
+    return Participant(
+        name=name,
+        tz=data["timezone"],
+        start_time=parse_time(data["start_time"]),
+        end_time=parse_time(data["end_time"]),
+        busy_slots=[busy_slot_from_dict(busy_slot) for busy_slot in busy_slots]
+    )
+
+
+class SchedulingHandler(BaseHTTPRequestHandler):
+    """Routes JSON requests to the server's RosterSession"""
+
+    protocol_version = "HTTP/1.1"  # keep-alive, so a client pays for one connect
+
+    def do_GET(self) -> None:
+        self.dispatch("GET")
+
+    def do_POST(self) -> None:
+        self.dispatch("POST")
+
+    def do_PUT(self) -> None:
+        self.dispatch("PUT")
+
+    def do_DELETE(self) -> None:
+        self.dispatch("DELETE")
+
+    def dispatch(self, method: str) -> None:
+        path = [unquote(part) for part in self.path.split('?', 1)[0].strip('/').split('/') if part]
+        try:
+            body = self.read_body()
+            status, reply = self.route(method, path, body)
+        except LookupError as e:
+            status, reply = 404, {"error": f"Not found: {e.args[0] if e.args else self.path}"}
+        except (TypeError, ValueError) as e:
+            status, reply = 400, {"error": str(e)}
+        except Exception as e:
+            logger.exception("Request failed: %s %s", method, self.path)
+            status, reply = 500, {"error": str(e)}
+        self.send_json(status, reply)
+
+    def read_body(self) -> Any:
+        length = int(self.headers.get("Content-Length") or 0)
+        if not length:
+            return {}
+        try:
+            body = json.loads(self.rfile.read(length))
+        except json.JSONDecodeError as e:
+            raise ValueError(f"Invalid JSON: {e}")
+        if not isinstance(body, dict):
+            raise ValueError("Request body must be a JSON object")
+        return body
+
+    def route(self, method: str, path: List[str], body: Dict[str, Any]) -> Tuple[int, Any]:
+        session: RosterSession = self.server.session
+
+        if path == ["health"] and method == "GET":
+            cache = session.cache
+            return 200, {"participants": len(session.participants), "cached_searches": len(cache),
+                         "cache_hits": cache.hits, "cache_misses": cache.misses}
+        if path == ["search"] and method == "POST":
+            reply = session.answer(body)
+            return (400 if "error" in reply else 200), reply
+        if path == ["participants"] and method == "GET":
+            return 200, [participant_to_dict(participant) for participant in session.participants]
+
+        if len(path) == 2 and path[0] == "participants":
+            if method == "PUT":
+                try:
+                    participant = participant_from_dict(path[1], body)
+                except KeyError as e:
+                    raise ValueError(f"Missing field: {e.args[0]}")
+                session.add_participant(participant)
+                return 200, participant_to_dict(participant)
+            if method == "DELETE":
+                return 200, participant_to_dict(session.remove_participant(path[1]))
+
+        if len(path) == 3 and path[0] == "participants" and path[2] == "busy" and method == "POST":
+            try:
+                busy_slot = busy_slot_from_dict(body)
+            except KeyError as e:
+                raise ValueError(f"Missing field: {e.args[0]}")
+            return 200, participant_to_dict(session.add_busy_slot(path[1], busy_slot))
+        if len(path) == 4 and path[0] == "participants" and path[2] == "busy" and method == "DELETE":
+            if not path[3].isdigit():
+                raise ValueError("Busy slot index must be a number")
+            return 200, busy_slot_to_dict(session.remove_busy_slot(path[1], int(path[3])))
+
+        raise LookupError(f"{method} /{'/'.join(path)}")
+
+    def send_json(self, status: int, reply: Any) -> None:
+        data = json.dumps(reply).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format: str, *args: Any) -> None:
+        logger.debug(format, *args)
+
+
+class SchedulingServer(ThreadingHTTPServer):
+    """Threaded localhost HTTP server holding one RosterSession"""
+
+    def __init__(self, session: RosterSession, port: int = DEFAULT_PORT):
+        self.session = session
+        super().__init__(("127.0.0.1", port), SchedulingHandler)
+
+
+def send_request(method: str, path: str, body: Optional[Dict[str, Any]] = None,
+                 port: int = DEFAULT_PORT, timeout: float = 30.0) -> Tuple[int, Any]:
+    """Local client: send one JSON request to a running daemon, return (status, reply)"""
+    from urllib.error import HTTPError
+    from urllib.request import Request, urlopen
+
+    data = json.dumps(body).encode() if body is not None else None
+    request = Request(f"http://127.0.0.1:{port}{path}", data=data, method=method,
+                      headers={"Content-Type": "application/json"})
+    try:
+        with urlopen(request, timeout=timeout) as response:
+            return response.status, json.loads(response.read())
+    except HTTPError as e:
+        return e.code, json.loads(e.read())
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="meet-zone serve",
+                                     description="Serve scheduling requests for a roster on localhost")
+    parser.add_argument("--roster", "-r", type=Path, required=True, help="Path to roster CSV file")
+    parser.add_argument("--port", "-p", type=int, default=DEFAULT_PORT,
+                        help=f"Port on 127.0.0.1 (default: {DEFAULT_PORT}, 0 picks a free one)")
+    parser.add_argument("--verbose", "-v", action="store_true", help="Log each request to stderr")
+    args = parser.parse_args(argv)
+
+    if args.verbose:
+        logging.basicConfig(level=logging.DEBUG, format='%(asctime)s - %(message)s', stream=sys.stderr)
+
+    try:
+        session = load_session(args.roster)
+        server = SchedulingServer(session, args.port)
+    except (OSError, ValueError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+
+    print(f"Serving {len(session.participants)} participants on http://127.0.0.1:{server.server_address[1]}",
+          file=sys.stderr)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
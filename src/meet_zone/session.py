@@ -0,0 +1,236 @@
+"""
+A parsed roster kept warm across many searches
+"""
+
+import threading
+from dataclasses import replace
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from meet_zone.availability import AvailabilityProfile, WeeklyAvailability, group_participants
+from meet_zone.cache import SlotCache
+from meet_zone.export import ExportManager
+from meet_zone.parser import BusySlot, BusySlotIndex, Participant, parse_roster
+from meet_zone.scheduler import TimeSlot, find_best_slots, get_search_dates
+from meet_zone.zones import ZoneOffsetResolver, is_known_timezone
+
+# Days of zone tables built up front; searches outside this extend them
+DEFAULT_HORIZON_DAYS = 14
+
+# Search request fields (as on the command line) and the option each sets
+REQUEST_FIELDS = {
+    "duration": "min_duration",
+    "top": "top_k",
+    "week": "show_week",
+    "days": "horizon_days",
+    "date": "start_date",
+    "prioritize": "prioritize_participants",
+    "quorum": "quorum",
+    "engine": "engine",
+    "interval": "interval_minutes",
+}
+
+# JSON type each request field must have
+REQUEST_TYPES = {
+    "duration": int,
+    "top": int,
+    "week": bool,
+    "days": int,
+    "date": str,
+    "prioritize": str,
+    "quorum": int,
+    "engine": str,
+    "interval": int,
+}
+TYPE_NAMES = {int: "an integer", bool: "true or false", str: "a string"}
+
+# Bounds on a request's search window; zone tables grow to cover every date searched
+MIN_REQUEST_DATE = date(1970, 1, 1)
+MAX_REQUEST_DATE = date(2099, 12, 31)
+MAX_REQUEST_DAYS = 366
+
+
+def parse_search_request(request: Dict[str, Any]) -> Tuple[Optional[List[str]], Dict[str, Any]]:
+    """Split a JSON search request into (participant names, find_best_slots options)
+
+    Fields mirror the command line: participants, duration, top, week, days,
+    date (YYYY-MM-DD), prioritize ("participants" or "duration"), quorum,
+    engine and interval. "id" is ignored here; anything else is an error,
+    as is a date or days outside MIN/MAX_REQUEST_DATE and MAX_REQUEST_DAYS.
+    """
+    unknown = set(request) - set(REQUEST_FIELDS) - {"id", "participants"}
+    if unknown:
+        raise ValueError(f"Unknown request fields: {', '.join(sorted(unknown))}")
+
+    names = request.get("participants")
+    if names is not None and (not isinstance(names, list) or not all(isinstance(name, str) for name in names)):
+        raise ValueError("participants must be a list of names")
+
+    options: Dict[str, Any] = {"min_duration": 30}
+    for field_name, option in REQUEST_FIELDS.items():
+        if field_name in request:
+            value = request[field_name]
+            expected = REQUEST_TYPES[field_name]
+            # bool is an int subclass, so true/false must not pass as numbers
+            if not isinstance(value, expected) or (expected is int and isinstance(value, bool)):
+                raise ValueError(f"{field_name} must be {TYPE_NAMES[expected]}")
+            options[option] = value
+    if "start_date" in options:
+        options["start_date"] = datetime.strptime(options["start_date"], "%Y-%m-%d").date()
+        if not MIN_REQUEST_DATE <= options["start_date"] <= MAX_REQUEST_DATE:
+            raise ValueError(f"date must be between {MIN_REQUEST_DATE} and {MAX_REQUEST_DATE}")
+    if "horizon_days" in options and not 1 <= options["horizon_days"] <= MAX_REQUEST_DAYS:
+        raise ValueError(f"days must be between 1 and {MAX_REQUEST_DAYS}")
+    if "prioritize_participants" in options:
+        if options["prioritize_participants"] not in ("participants", "duration"):
+            raise ValueError("prioritize must be 'participants' or 'duration'")
+        options["prioritize_participants"] = options["prioritize_participants"] == "participants"
+    return names, options
+
+
+class RosterSession:
+    """Roster, zone tables and compiled availability shared by many searches
+
+    Each participant's weekly availability is compiled once and reused
+    until their busy slots change, the zone offset tables grow to cover
+    every date searched, and candidate slots are memoized per subset and
+    search window. Searches may name any subset of the roster.
+
+    Updates are copy-on-write: a changed participant (or the roster list,
+    or a widened resolver) is a new object swapped in under a lock, so
+    searches running in other threads keep a consistent snapshot and only
+    the changed participant is recompiled.
+    """
+
+    def __init__(self, participants: List[Participant], start_date: Optional[date] = None,
+                 horizon_days: int = DEFAULT_HORIZON_DAYS, cache_size: int = 64):
+        self.participants = list(participants)
+        unknown_zones = sorted({participant.tz for participant in self.participants if not is_known_timezone(participant.tz)})
+        if unknown_zones:
+            raise ValueError(f"Unknown timezone: {', '.join(unknown_zones)}")
+        start_date = start_date or date.today()
+        self.resolver = ZoneOffsetResolver(start_date, start_date + timedelta(days=horizon_days - 1))
+        self.resolver.prepare({participant.tz for participant in self.participants})
+        self.cache = SlotCache(cache_size)
+        self._compiled: Dict[int, Tuple[Participant, BusySlotIndex, WeeklyAvailability]] = {}
+        self._lock = threading.RLock()
+
+    @classmethod
+    def from_roster(cls, file_path: Path, **kwargs: Any) -> 'RosterSession':
+        return cls(parse_roster(file_path), **kwargs)
+
+    def select(self, names: Optional[Iterable[str]] = None) -> List[Participant]:
+        """Roster entries for the given names (everyone if None), in roster order"""
+        if names is None:
+            return list(self.participants)
+        wanted = set(names)
+        missing = wanted - {participant.name for participant in self.participants}
+        if missing:
+            raise ValueError(f"Unknown participants: {', '.join(sorted(missing))}")
+        return [participant for participant in self.participants if participant.name in wanted]
+
+    def get(self, name: str) -> Participant:
+        """Roster entry by name; KeyError if there is none"""
+        for participant in self.participants:
+            if participant.name == name:
+                return participant
+        raise KeyError(name)
+
+    def add_participant(self, participant: Participant) -> None:
+        """Add a participant, replacing any roster entry with the same name"""
+        try:
+            self.resolver.prepare([participant.tz])
+        except (KeyError, ValueError):
+            raise ValueError(f"Unknown timezone: {participant.tz}")
+        with self._lock:
+            previous = next((entry for entry in self.participants if entry.name == participant.name), None)
+            if previous is None:
+                self.participants = self.participants + [participant]
+            else:
+                self.participants = [participant if entry is previous else entry for entry in self.participants]
+                self._forget(previous)
+
+    def remove_participant(self, name: str) -> Participant:
+        """Remove and return a participant by name"""
+        with self._lock:
+            participant = self.get(name)
+            self.participants = [entry for entry in self.participants if entry is not participant]
+            self._forget(participant)
+            return participant
+
+    def add_busy_slot(self, name: str, busy_slot: BusySlot) -> Participant:
+        """Add a busy slot to a participant; returns the updated entry"""
+        with self._lock:
+            participant = self.get(name)
+            return self._swap(participant, participant.busy_slots + [busy_slot])
+
+    def remove_busy_slot(self, name: str, index: int) -> BusySlot:
+        """Remove and return a participant's busy slot by position"""
+        with self._lock:
+            participant = self.get(name)
+            if not 0 <= index < len(participant.busy_slots):
+                raise IndexError(f"{name} busy slot {index}")
+            busy_slots = list(participant.busy_slots)
+            busy_slot = busy_slots.pop(index)
+            self._swap(participant, busy_slots)
+            return busy_slot
+
+    def _swap(self, participant: Participant, busy_slots: List[BusySlot]) -> Participant:
+        updated = replace(participant, busy_slots=busy_slots)
+        self.participants = [updated if entry is participant else entry for entry in self.participants]
+        self._forget(participant)
+        return updated
+
+    def _forget(self, participant: Participant) -> None:
+        self._compiled.pop(id(participant), None)
+
+    def _resolver_for(self, options: Dict[str, Any]) -> ZoneOffsetResolver:
+        """Resolver covering a search's dates; a wider one replaces the shared one"""
+        dates = get_search_dates(options.get("start_date"), options.get("show_week", False),
+                                 options.get("horizon_days"))
+        if not dates or self.resolver.covers(dates[0], dates[-1]):
+            return self.resolver
+        resolver = ZoneOffsetResolver(min(dates[0], self.resolver.start_date), max(dates[-1], self.resolver.end_date))
+        resolver.prepare({participant.tz for participant in self.participants})
+        self.resolver = resolver
+        return resolver
+
+    def compiled(self, participant: Participant) -> WeeklyAvailability:
+        """Compiled availability for a participant, rebuilt if their busy slots changed"""
+        index = participant.get_busy_index()
+        entry = self._compiled.get(id(participant))
+        if entry is None or entry[0] is not participant or entry[1] is not index:
+            entry = (participant, index, WeeklyAvailability(participant))
+            self._compiled[id(participant)] = entry
+        return entry[2]
+
+    def profiles_for(self, participants: List[Participant]) -> List[AvailabilityProfile]:
+        """Availability profiles for a subset, reusing compiled availability"""
+        return group_participants(participants, self.compiled)
+
+    def find_best_slots(self, names: Optional[Iterable[str]] = None, **options: Any) -> List[TimeSlot]:
+        """find_best_slots over a subset of the roster with warm tables"""
+        with self._lock:
+            participants = self.select(names)
+            profiles = self.profiles_for(participants)
+            resolver = self._resolver_for(options)
+        return find_best_slots(
+            participants,
+            resolver=resolver,
+            profiles=profiles,
+            cache=self.cache,
+            **options
+        )
+
+    def answer(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """Run a JSON search request; errors are reported in the reply"""
+        reply: Dict[str, Any] = {"id": request.get("id")}
+        try:
+            names, options = parse_search_request(request)
+            slots = self.find_best_slots(names, **options)
+        except (TypeError, ValueError, OverflowError) as e:
+            reply["error"] = str(e)
+            return reply
+        reply["slots"] = [ExportManager.slot_to_dict(slot) for slot in slots]
+        return reply
@@ -0,0 +1,89 @@
+"""
+Startup benchmark: per-module import times for the meet-zone entry points
+
+Run with `python -m meet_zone.startup`. Each run imports a target in a fresh
+interpreter under `-X importtime`, after one warm-up run so bytecode caches
+exist, and the median over all runs is reported per module.
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+from typing import Dict, List, Tuple
+
+# What each entry point imports before it can do useful work
+TARGETS = {
+    "headless": "import meet_zone.__main__, meet_zone.parser, meet_zone.scheduler, meet_zone.export",
+    "ui": "import meet_zone.__main__, meet_zone.parser, meet_zone.scheduler, meet_zone.ui",
+}
+
+
+def parse_importtime(output: str) -> Dict[str, Tuple[int, int]]:
+    """Map module name to (self, cumulative) microseconds from -X importtime output"""
+    times: Dict[str, Tuple[int, int]] = {}
+    for line in output.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        fields = line[len("import time:"):].split("|")
+        if len(fields) != 3 or not fields[0].strip().isdigit():
+            continue  # header line
+        times[fields[2].strip()] = (int(fields[0]), int(fields[1]))
+    return times
+
+
+def measure(statement: str) -> Dict[str, Tuple[int, int]]:
+    """Import times for one fresh interpreter running a statement"""
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, [
+        os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+        os.environ.get("PYTHONPATH")
+    ])))
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        env=env, capture_output=True, text=True
+    )
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr.strip().splitlines()[-1] if result.stderr.strip() else "import failed")
+    return parse_importtime(result.stderr)
+
+
+def benchmark(statement: str, runs: int = 5) -> List[Tuple[str, float, float]]:
+    """Median (module, self ms, cumulative ms) over several runs, slowest first"""
+    measure(statement)
+    samples = [measure(statement) for _ in range(runs)]
+    modules = set().union(*samples)
+
+    rows = []
+    for module in modules:
+        self_times = [sample[module][0] for sample in samples if module in sample]
+        cumulative = [sample[module][1] for sample in samples if module in sample]
+        rows.append((module, statistics.median(self_times) / 1000, statistics.median(cumulative) / 1000))
+    rows.sort(key=lambda row: row[2], reverse=True)
+    return rows
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Report import time per module for meet-zone startup")
+    parser.add_argument("--target", choices=sorted(TARGETS), default="headless",
+                        help="Entry point to measure")
+    parser.add_argument("--runs", type=int, default=5, help="Measured runs (median is reported)")
+    parser.add_argument("--limit", type=int, default=25, help="Number of modules to show")
+    args = parser.parse_args()
+
+    try:
+        rows = benchmark(TARGETS[args.target], max(args.runs, 1))
+    except RuntimeError as e:
+        print(f"Error: could not import the {args.target} target: {e}", file=sys.stderr)
+        return 1
+
+    total = sum(self_ms for _, self_ms, _ in rows)
+    print(f"{args.target}: {total:.1f} ms in {len(rows)} modules (median of {args.runs} runs)")
+    print(f"{'cumulative':>11}  {'self':>8}  module")
+    for module, self_ms, cumulative_ms in rows[:args.limit]:
+        print(f"{cumulative_ms:9.1f}ms  {self_ms:6.1f}ms  {module}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
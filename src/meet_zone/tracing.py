@@ -0,0 +1,119 @@
+"""
+Structured trace events and timing stats for the scheduler
+"""
+
+import logging
+import time
+from contextlib import contextmanager, nullcontext
+from dataclasses import dataclass, field
+from typing import Any, Callable, ContextManager, Dict, Iterator, Optional
+
+# Verbosity levels: search and per-date progress, then per-slot detail
+TRACE_SUMMARY = 1
+TRACE_DETAIL = 2
+
+TraceSink = Callable[[str, Dict[str, Any]], None]
+
+
+class Tracer:
+    """Sends structured trace events to a sink at a chosen verbosity
+
+    The sink is any callable taking (event, fields); fields hold raw values
+    (dates, datetimes, name sets) and formatting is left to the sink.
+    Callers in loops check wants() before building fields, and the
+    scheduler skips tracing entirely when no tracer is given.
+    """
+
+    def __init__(self, sink: TraceSink, level: int = TRACE_SUMMARY):
+        self.sink = sink
+        self.level = level
+
+    def wants(self, level: int) -> bool:
+        return level <= self.level
+
+    def emit(self, level: int, event: str, **fields: Any) -> None:
+        if level <= self.level:
+            self.sink(event, fields)
+
+    @classmethod
+    def to_logger(cls, logger: Optional[logging.Logger] = None, level: int = TRACE_SUMMARY) -> 'Tracer':
+        """Tracer that writes events to a logger at DEBUG level"""
+        logger = logger or logging.getLogger("meet_zone.scheduler")
+
+        def sink(event: str, fields: Dict[str, Any]) -> None:
+            logger.debug("%s %s", event, fields)
+
+        return cls(sink, level)
+
+    @classmethod
+    def to_console(cls, level: int = TRACE_SUMMARY) -> 'Tracer':
+        """Tracer that prints one line per event"""
+        def sink(event: str, fields: Dict[str, Any]) -> None:
+            details = " ".join(f"{key}={value}" for key, value in fields.items())
+            print(f"[{event}] {details}")
+
+        return cls(sink, level)
+
+
+# Search phases in the order they run
+PHASES = ("zones", "availability", "slots", "scoring", "dedup")
+
+
+@dataclass
+class SearchStats:
+    """Where a search spends its time and how many slots it handles
+
+    phase_seconds holds wall time per phase (see PHASES); with a process
+    pool, the per-date phases are summed over the workers. availability_checks
+    counts profile evaluations: one per profile and grid sample, or one per
+    profile and date for the interval engines.
+    """
+    phase_seconds: Dict[str, float] = field(default_factory=dict)
+    total_seconds: float = 0.0
+    dates_searched: int = 0
+    availability_checks: int = 0
+    candidate_slots: int = 0
+    duplicate_slots: int = 0
+    peak_candidates: int = 0
+    fallback_used: bool = False
+    cache_hit: bool = False
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Add the wall time of a block to a phase"""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phase_seconds[name] = self.phase_seconds.get(name, 0.0) + time.perf_counter() - started
+
+    def merge(self, other: 'SearchStats') -> None:
+        """Add per-date counters and phase times recorded elsewhere (e.g., in a worker)"""
+        for name, seconds in other.phase_seconds.items():
+            self.phase_seconds[name] = self.phase_seconds.get(name, 0.0) + seconds
+        self.availability_checks += other.availability_checks
+
+    def merge_slot_counts(self, other: 'SearchStats') -> None:
+        """Add candidate and duplicate counts from one rung of a search"""
+        self.candidate_slots += other.candidate_slots
+        self.duplicate_slots += other.duplicate_slots
+        self.peak_candidates = max(self.peak_candidates, other.peak_candidates)
+
+    def summary(self) -> str:
+        """One-line summary for a status line or log"""
+        phases = ", ".join(
+            f"{name} {self.phase_seconds[name]:.2f}s" for name in PHASES if name in self.phase_seconds
+        )
+        text = (
+            f"{self.total_seconds:.2f}s ({phases}); {self.dates_searched} dates, "
+            f"{self.availability_checks:,} checks, {self.candidate_slots:,} candidates, "
+            f"{self.duplicate_slots:,} duplicates, peak {self.peak_candidates:,}"
+        )
+        if self.fallback_used:
+            text += " (fallback)"
+        return text + " (cached)" if self.cache_hit else text
+
+
+def timed_phase(stats: Optional[SearchStats], name: str) -> ContextManager:
+    """stats.phase(name), or a no-op when stats are not being collected"""
+    return stats.phase(name) if stats is not None else nullcontext()
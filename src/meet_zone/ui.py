@@ -1,21 +1,26 @@
 import re
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from datetime import datetime, time, date
-from typing import Dict, List, Optional, Set, Tuple
+from time import perf_counter
+from typing import Dict, Iterable, List, Optional, Set, Tuple
 
-from textual import on
+from textual import on, work
 from textual.app import App, ComposeResult
 from textual.containers import Container, Horizontal, Vertical
 from textual.coordinate import Coordinate
 from textual.widgets import (
     Button, DataTable, Footer, Header, Input, Label,
-    Select, Static, TabPane, TabbedContent, TextArea
+    ProgressBar, Select, Static, TabPane, TabbedContent, TextArea
 )
 from textual.reactive import reactive
 from textual.validation import Validator
+from textual.worker import Worker, get_current_worker
 
 from meet_zone.parser import Participant, BusySlot
-from meet_zone.scheduler import TimeSlot, find_best_slots, get_participant_busy_summary
+from meet_zone.scheduler import SearchCancelled, TimeSlot, find_best_slots, get_participant_busy_summary, get_search_dates
+from meet_zone.cache import SlotCache
+from meet_zone.live import LiveAvailability
+from meet_zone.tracing import SearchStats
 
 
 class TimeValidator(Validator):
@@ -98,6 +103,13 @@ class MeetZoneApp(App):
         min-height: 5;
         border: solid $primary;
     }
+    #search-progress {
+        display: none;
+        margin-bottom: 1;
+    }
+    #search-progress.searching {
+        display: block;
+    }
     #form-container {
         height: auto;
         max-height: 40vh;
@@ -223,6 +235,19 @@ class MeetZoneApp(App):
     status_message = reactive("")
     selected_participant_index = reactive(-1)
 
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Candidate slots from earlier searches, re-ranked when only top/priority change
+        self.slot_cache = SlotCache()
+        self.search_worker: Optional[Worker] = None
+        # True from a search's start until its results (or cancellation) are shown
+        self.searching = False
+        self.live_worker: Optional[Worker] = None
+        # Availability of the last search's dates, kept current as the roster is edited
+        self.live: Optional[LiveAvailability] = None
+        self.live_query: dict = {}
+        self.roster_version = 0
+
     def compose(self) -> ComposeResult:
         yield Header()
         with TabbedContent(id="main-tabs"):
@@ -315,7 +340,8 @@ class MeetZoneApp(App):
                             yield Input(placeholder="YYYY-MM-DD", id="start-date-field", classes="form-input")
                         with Horizontal(classes="form-row"):
                             yield Button("Find Meeting Times", id="btn-find", classes="form-button")
-                    yield Static("Meeting Time Results:", classes="subsection-title")
+                    yield ProgressBar(id="search-progress", show_eta=False)
+                    yield Static("Meeting Time Results:", id="results-title", classes="subsection-title")
                     yield DataTable(id="results-table")
         yield Footer()
 
@@ -481,6 +507,7 @@ class MeetZoneApp(App):
 
         participant = Participant(name=name, tz=timezone, start_time=start_time, end_time=end_time)
         self.participants.append(participant)
+        self.roster_changed([name])
 
         self.update_participants_table()
         self.update_participant_select()
@@ -502,6 +529,7 @@ class MeetZoneApp(App):
         if coord:
             row_key, _ = table.coordinate_to_cell_key(coord)
             removed = self.participants.pop(row_index)
+            self.roster_changed([removed.name])
             self.update_participants_table()
             self.update_participant_select()
             self.update_busy_schedule_table()
@@ -517,6 +545,7 @@ class MeetZoneApp(App):
             return
         count = len(self.participants)
         self.participants = []
+        self.roster_changed()
         self.update_participants_table()
         self.update_participant_select()
         self.update_busy_schedule_table()
@@ -573,6 +602,7 @@ class MeetZoneApp(App):
             description=description,
             recurring=recurring
         )
+        self.roster_changed([participant.name])
 
         # Update tables
         self.update_participants_table()
@@ -600,7 +630,8 @@ class MeetZoneApp(App):
             for i, busy_slot in enumerate(participant.busy_slots):
                 if current_row == row_index:
                     # Remove this busy slot
-                    participant.busy_slots.pop(i)
+                    participant.remove_busy_slot(i)
+                    self.roster_changed([participant.name])
                     self.update_participants_table()
                     self.update_busy_schedule_table()
                     self.update_message(f"Success: Removed busy time for {participant.name}", busy=True)
@@ -611,19 +642,55 @@ class MeetZoneApp(App):
 
     def clear_busy_schedules(self) -> None:
         count = 0
+        changed = set()
         for participant in self.participants:
-            count += len(participant.busy_slots)
-            participant.busy_slots.clear()
+            if participant.busy_slots:
+                count += len(participant.busy_slots)
+                changed.add(participant.name)
+            participant.clear_busy_slots()
 
         if count == 0:
             self.update_message("No busy schedules to clear", busy=True)
             return
+        self.roster_changed(changed)
 
         self.update_participants_table()
         self.update_busy_schedule_table()
         self.update_message(f"Success: Cleared {count} busy schedule entries", busy=True)
 
+    def roster_changed(self, names: Optional[Iterable[str]] = None) -> None:
+        """Drop cached search results after participants or busy slots change
+
+        With the names whose entries changed, the live model of the last
+        search applies just their changes and the results table is updated
+        in place; without them (e.g., the roster was cleared) it is dropped.
+        """
+        self.slot_cache.clear()
+        self.roster_version += 1
+        if self.live is None:
+            return
+        if names is None or not self.participants:
+            self.live = None
+            return
+
+        started = perf_counter()
+        for name in set(names):
+            self.live.set(name, [participant for participant in self.participants if participant.name == name])
+        slots = self.live.find_best_slots(**self.live_query)
+        self.fill_results_table(slots, self.live.participant_count)
+        elapsed_ms = (perf_counter() - started) * 1000
+        self.query_one("#results-title", Static).update(
+            f"Meeting Time Results (updated for roster changes in {elapsed_ms:.0f} ms):"
+        )
+
     def calculate_meeting_times(self) -> None:
+        # Pressing the button during a search cancels it
+        if self.searching:
+            self.search_worker.cancel()
+            self.end_search()
+            self.update_message("Search cancelled")
+            return
+
         if not self.participants:
             self.update_message("Error: Add participants first")
             self.query_one(TabbedContent).active = "tab-participants"
@@ -653,42 +720,145 @@ class MeetZoneApp(App):
             return
 
         self.update_message("Processing meeting slots (considering busy schedules)...")
+        progress = self.query_one("#search-progress", ProgressBar)
+        progress.update(total=len(get_search_dates(start_date, show_week)), progress=0)
+        progress.add_class("searching")
+        self.query_one("#btn-find", Button).label = "Cancel Search"
+        self.fill_results_table([], len(self.participants))
+        self.query_one("#results-title", Static).update("Meeting Time Results (searching...):")
+        self.live = None
+        if self.live_worker is not None:
+            self.live_worker.cancel()
+        self.searching = True
+
+        # The worker searches a snapshot, so edits made meanwhile cannot race it
+        participants = [
+            replace(participant, busy_slots=list(participant.busy_slots))
+            for participant in self.participants
+        ]
+        self.search_worker = self.run_search(participants, dict(
+            min_duration=self.min_duration,
+            show_week=self.display_full_week,
+            top_k=self.top_results,
+            start_date=start_date,
+            prioritize_participants=prioritize_by_participants
+        ), self.roster_version)
+
+    @work(thread=True, exclusive=True, group="search")
+    def run_search(self, participants: List[Participant], options: dict, roster_version: int) -> None:
+        """Run find_best_slots off the event loop, posting progress and results back"""
+        worker = get_current_worker()
+
+        def progress(done: int, total: int) -> None:
+            if worker.is_cancelled:
+                raise SearchCancelled()
+            self.call_from_thread(self.update_search_progress, done)
+
+        def interim(slots: List[TimeSlot]) -> None:
+            if not worker.is_cancelled:
+                self.call_from_thread(self.show_interim_results, slots, len(participants))
+
+        stats = SearchStats()
         try:
-            slots = find_best_slots(
-                participants=self.participants,
-                min_duration=self.min_duration,
-                show_week=self.display_full_week,
-                top_k=self.top_results,
-                start_date=start_date,
-                prioritize_participants=prioritize_by_participants
-            )
+            slots = find_best_slots(participants, stats=stats, cache=self.slot_cache, progress=progress,
+                                    interim=interim, cancelled=lambda: worker.is_cancelled, **options)
+        except SearchCancelled:
+            return
         except Exception as e:
-            self.update_message(f"Error: {e}")
+            if not worker.is_cancelled:
+                self.call_from_thread(self.search_failed, e)
+            return
+        if worker.is_cancelled:
             return
+        self.call_from_thread(self.search_finished, worker, slots, participants, options, stats, roster_version)
 
+    def search_finished(self, worker: Worker, slots: List[TimeSlot], participants: List[Participant],
+                        options: dict, stats: SearchStats, roster_version: int) -> None:
+        # The search may have been cancelled while this call was queued
+        if worker.is_cancelled:
+            return
+        self.show_search_results(slots, len(participants), stats)
+        self.live_worker = self.build_live_model(participants, options, roster_version)
+
+    @work(thread=True, exclusive=True, group="live")
+    def build_live_model(self, participants: List[Participant], options: dict, roster_version: int) -> None:
+        """Load a finished search's dates into a LiveAvailability off the event loop
+
+        Later roster edits then update the results without another search.
+        It runs in its own group, so the search is over (and Find starts a
+        new one) while the model is still being built.
+        """
+        worker = get_current_worker()
+        live = LiveAvailability(participants, get_search_dates(options["start_date"], options["show_week"]))
+        query = dict(min_duration=options["min_duration"], top_k=options["top_k"],
+                     prioritize_participants=options["prioritize_participants"])
+        if not worker.is_cancelled:
+            self.call_from_thread(self.set_live_model, worker, live, query, roster_version)
+
+    def set_live_model(self, worker: Worker, live: LiveAvailability, query: dict, roster_version: int) -> None:
+        # A model from a superseded search, or a roster that has since changed, would be stale
+        if not worker.is_cancelled and roster_version == self.roster_version:
+            self.live = live
+            self.live_query = query
+
+    def update_search_progress(self, dates_done: int) -> None:
+        self.query_one("#search-progress", ProgressBar).update(progress=dates_done)
+
+    def end_search(self, title: str = "Meeting Time Results (partial, search cancelled):") -> None:
+        """Hide the progress bar, restore the find button and label the results"""
+        self.searching = False
+        self.query_one("#search-progress", ProgressBar).remove_class("searching")
+        self.query_one("#btn-find", Button).label = "Find Meeting Times"
+        self.query_one("#results-title", Static).update(title)
+
+    def show_interim_results(self, slots: List[TimeSlot], participant_count: int) -> None:
+        """Best slots of the dates searched so far, while the search continues"""
+        self.fill_results_table(slots, participant_count)
+        self.query_one("#results-title", Static).update("Meeting Time Results (best so far):")
+
+    def search_failed(self, error: Exception) -> None:
+        self.end_search("Meeting Time Results:")
+        self.update_message(f"Error: {error}")
+
+    def show_search_results(self, slots: List[TimeSlot], participant_count: int, stats: SearchStats) -> None:
+        self.end_search("Meeting Time Results (final):")
         results_table = self.query_one("#results-table", DataTable)
-        results_table.clear()
+        self.fill_results_table(slots, participant_count)
 
         if not slots:
             self.update_message("No slots found. Check busy schedules and try adjusting parameters.")
             return
 
-        for slot in slots:
+        self.query_one(TabbedContent).active = "tab-results"
+        self.update_message(f"Success: Found {len(slots)} options (busy schedules considered) in {stats.summary()}")
+        results_table.focus()
+
+    def fill_results_table(self, slots: List[TimeSlot], participant_count: int) -> None:
+        """Show slots in the results table, updating only the cells that changed"""
+        results_table = self.query_one("#results-table", DataTable)
+        for row, slot in enumerate(slots):
             duration_minutes = slot.get_duration_minutes()
             names = ", ".join(sorted(slot.participant_names))
             score_pct = int(slot.score * 100)
-            results_table.add_row(
+            cells = (
                 slot.start_time.strftime("%Y-%m-%d %H:%M"),
                 slot.end_time.strftime("%Y-%m-%d %H:%M"),
                 f"{duration_minutes} min",
-                f"{slot.participant_count}/{len(self.participants)}",
+                f"{slot.participant_count}/{participant_count}",
                 f"{score_pct}%",
                 names
             )
-
-        self.query_one(TabbedContent).active = "tab-results"
-        self.update_message(f"Success: Found {len(slots)} options (busy schedules considered)")
-        results_table.focus()
+            if row >= results_table.row_count:
+                results_table.add_row(*cells)
+                continue
+            for column, value in enumerate(cells):
+                if results_table.get_cell_at(Coordinate(row, column)) != value:
+                    results_table.update_cell_at(Coordinate(row, column), value)
+
+        # Drop rows left over from a longer list
+        while results_table.row_count > len(slots):
+            last = Coordinate(results_table.row_count - 1, 0)
+            results_table.remove_row(results_table.coordinate_to_cell_key(last).row_key)
 
     def watch_status_message(self, message: str) -> None:
         message_widget = self.query_one("#message-text", Static)
@@ -725,7 +895,8 @@ def display_results(
     min_duration: int = 30,
     show_week: bool = False,
     prioritize_participants: bool = True,
-    start_date: Optional[date] = None
+    start_date: Optional[date] = None,
+    stats: Optional[SearchStats] = None
 ) -> MeetZoneApp:
     app = MeetZoneApp()
     if participants:
@@ -746,20 +917,10 @@ def display_results(
                 date_input = app.query_one("#start-date-field", Input)
                 date_input.value = start_date.strftime("%Y-%m-%d")
 
-            results = app.query_one("#results-table", DataTable)
-            for slot in slots:
-                duration_minutes = slot.get_duration_minutes()
-                names = ", ".join(sorted(slot.participant_names))
-                score_pct = int(slot.score * 100)
-                results.add_row(
-                    slot.start_time.strftime("%Y-%m-%d %H:%M"),
-                    slot.end_time.strftime("%Y-%m-%d %H:%M"),
-                    f"{duration_minutes} min",
-                    f"{slot.participant_count}/{len(app.participants)}",
-                    f"{score_pct}%",
-                    names
-                )
+            app.fill_results_table(slots, len(app.participants))
             app.query_one(TabbedContent).active = "tab-results"
+            if stats is not None:
+                app.update_message(f"Success: Found {len(slots)} options in {stats.summary()}")
 
         app.call_after_refresh(load_results)
 
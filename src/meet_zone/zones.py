@@ -0,0 +1,197 @@
+"""
+Precomputed UTC-offset tables for fast local/UTC conversion
+"""
+
+from bisect import bisect_right
+from functools import lru_cache
+from datetime import date, datetime, timedelta, timezone
+from typing import Dict, Iterable, List, Optional, Tuple
+from zoneinfo import ZoneInfo
+
+MINUTES_PER_DAY = 24 * 60
+EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+
+# Offsets are sampled this often when looking for transitions
+SAMPLE_STEP_MINUTES = 6 * 60
+
+# Days added on both sides of the horizon so neighbouring local days resolve
+HORIZON_PADDING_DAYS = 2
+
+
+def date_to_minutes(value: date) -> int:
+    """Minutes since the epoch at midnight of a date"""
+    return (value.toordinal() - EPOCH_ORDINAL) * MINUTES_PER_DAY
+
+
+def minutes_to_date(minutes: int) -> date:
+    """Date containing a minutes-since-epoch value"""
+    return date.fromordinal(EPOCH_ORDINAL + minutes // MINUTES_PER_DAY)
+
+
+def datetime_to_minutes(value: datetime) -> int:
+    """Minutes since the epoch for an aware datetime (seconds are dropped)"""
+    return int(value.timestamp() // 60)
+
+
+def minutes_to_datetime(minutes: int) -> datetime:
+    """Aware UTC datetime for a minutes-since-epoch value"""
+    return datetime(1970, 1, 1, tzinfo=timezone.utc) + timedelta(minutes=minutes)
+
+
+class ZoneOffsetResolver:
+    """UTC-offset transition tables for a search horizon
+
+    Each zone's offset change points (DST transitions) inside the horizon
+    are found once, after which every conversion is a bisect plus integer
+    minute arithmetic. All values are minutes since the epoch; local values
+    are wall-clock minutes. Queries outside the horizon widen it.
+    """
+
+    def __init__(self, start_date: date, end_date: date):
+        self.start_date = start_date
+        self.end_date = end_date
+        self.start_minute = date_to_minutes(start_date - timedelta(days=HORIZON_PADDING_DAYS))
+        self.end_minute = date_to_minutes(end_date + timedelta(days=HORIZON_PADDING_DAYS + 1))
+        self._tables: Dict[str, Tuple[List[int], List[int], List[int]]] = {}
+
+    def covers(self, start_date: date, end_date: date) -> bool:
+        """Whether the horizon includes the given date range"""
+        return self.start_date <= start_date and end_date <= self.end_date
+
+    def extend(self, start_date: date, end_date: date) -> None:
+        """Grow the horizon (and drop built tables) to include a date range"""
+        if self.covers(start_date, end_date):
+            return
+        self.start_date = min(self.start_date, start_date)
+        self.end_date = max(self.end_date, end_date)
+        self.start_minute = date_to_minutes(self.start_date - timedelta(days=HORIZON_PADDING_DAYS))
+        self.end_minute = date_to_minutes(self.end_date + timedelta(days=HORIZON_PADDING_DAYS + 1))
+        self._tables.clear()
+
+    def prepare(self, tz_names: Iterable[str]) -> None:
+        """Build the tables for several zones up front"""
+        for tz_name in tz_names:
+            self._table(tz_name)
+
+    def _ensure(self, minute: int) -> None:
+        """Grow the horizon (and drop built tables) if a minute falls outside it"""
+        if self.start_minute + MINUTES_PER_DAY <= minute < self.end_minute - MINUTES_PER_DAY:
+            return
+        day = minutes_to_date(minute)
+        self.extend(day, day)
+
+    def _zone_offset(self, tz_name: str, utc_minute: int) -> int:
+        """Offset in minutes straight from ZoneInfo"""
+        utc_dt = minutes_to_datetime(utc_minute)
+        return int(utc_dt.astimezone(ZoneInfo(tz_name)).utcoffset().total_seconds() // 60)
+
+    def _table(self, tz_name: str) -> Tuple[List[int], List[int], List[int]]:
+        """(transition starts, offsets, local fold=0 thresholds) for a zone"""
+        table = self._tables.get(tz_name)
+        if table is not None:
+            return table
+
+        starts = [self.start_minute]
+        offsets = [self._zone_offset(tz_name, self.start_minute)]
+        previous = self.start_minute
+        for sample in range(self.start_minute + SAMPLE_STEP_MINUTES, self.end_minute + SAMPLE_STEP_MINUTES, SAMPLE_STEP_MINUTES):
+            offset = self._zone_offset(tz_name, sample)
+            if offset != offsets[-1]:
+                # Binary search for the first minute with the new offset
+                low, high = previous, sample
+                while high - low > 1:
+                    middle = (low + high) // 2
+                    if self._zone_offset(tz_name, middle) == offset:
+                        high = middle
+                    else:
+                        low = middle
+                starts.append(high)
+                offsets.append(offset)
+            previous = sample
+
+        # A wall time belongs after a transition once it is past both of the
+        # transition's wall-clock readings, matching ZoneInfo's fold=0 choice
+        # in gaps (earlier offset) and overlaps (first occurrence).
+        thresholds = [
+            starts[i] + max(offsets[i - 1], offsets[i])
+            for i in range(1, len(starts))
+        ]
+
+        table = (starts, offsets, thresholds)
+        self._tables[tz_name] = table
+        return table
+
+    def utc_offset(self, tz_name: str, utc_minute: int) -> int:
+        """UTC offset in minutes in effect at a UTC instant"""
+        self._ensure(utc_minute)
+        starts, offsets, _ = self._table(tz_name)
+        return offsets[bisect_right(starts, utc_minute) - 1]
+
+    def fixed_offset(self, tz_name: str, utc_start: int, utc_end: int) -> Optional[int]:
+        """Offset in effect throughout [utc_start, utc_end), or None if it changes"""
+        self._ensure(utc_start)
+        self._ensure(utc_end)
+        starts, offsets, _ = self._table(tz_name)
+        i = bisect_right(starts, utc_start) - 1
+        if i + 1 < len(starts) and starts[i + 1] < utc_end:
+            return None
+        return offsets[i]
+
+    def to_local(self, tz_name: str, utc_minute: int) -> int:
+        """Convert a UTC instant to local wall-clock minutes"""
+        return utc_minute + self.utc_offset(tz_name, utc_minute)
+
+    def to_utc(self, tz_name: str, local_minute: int) -> int:
+        """Convert local wall-clock minutes to a UTC instant (fold=0 semantics)"""
+        self._ensure(local_minute)
+        _, offsets, thresholds = self._table(tz_name)
+        return local_minute - offsets[bisect_right(thresholds, local_minute)]
+
+    def local_range_to_utc(self, tz_name: str, local_start: int, local_end: int) -> List[Tuple[int, int]]:
+        """UTC intervals whose wall-clock time falls inside [local_start, local_end)
+
+        Wall times skipped by a gap produce no UTC time, and wall times
+        repeated by an overlap produce both occurrences.
+        """
+        if local_end <= local_start:
+            return []
+        self._ensure(local_start)
+        self._ensure(local_end)
+
+        starts, offsets, _ = self._table(tz_name)
+        low = local_start - max(offsets)
+        high = local_end - min(offsets)
+
+        intervals: List[Tuple[int, int]] = []
+        i = max(bisect_right(starts, low) - 1, 0)
+        while i < len(starts) and starts[i] < high:
+            segment_start = starts[i] if i > 0 else low
+            segment_end = starts[i + 1] if i + 1 < len(starts) else high
+            piece_start = max(local_start - offsets[i], segment_start)
+            piece_end = min(local_end - offsets[i], segment_end)
+            if piece_start < piece_end:
+                if intervals and intervals[-1][1] == piece_start:
+                    intervals[-1] = (intervals[-1][0], piece_end)
+                else:
+                    intervals.append((piece_start, piece_end))
+            i += 1
+        return intervals
+
+
+@lru_cache(maxsize=256)
+def is_known_timezone(tz_name: str) -> bool:
+    """Whether ZoneInfo has a zone of this name"""
+    try:
+        ZoneInfo(tz_name)
+    except (KeyError, ValueError):  # ZoneInfoNotFoundError is a KeyError
+        return False
+    return True
+
+
+@lru_cache(maxsize=32)
+def default_resolver(day: date) -> ZoneOffsetResolver:
+    """Shared resolver around one date, for conversions made without a resolver
+
+    Each zone's table is then built once per date rather than once per call.
+    """
+    return ZoneOffsetResolver(day, day)
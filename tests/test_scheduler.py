@@ -0,0 +1,27 @@
+from datetime import date, time
+
+import pytest
+
+from meet_zone.parser import Participant
+from meet_zone.scheduler import ENGINES, SearchCancelled, find_best_slots
+
+ROSTER = [
+    Participant("Alice", "UTC", time(6, 0), time(18, 0)),
+    Participant("Bob", "Europe/Berlin", time(9, 0), time(17, 0)),
+]
+
+
+@pytest.mark.parametrize("engine", ENGINES)
+def test_single_day_search_can_be_cancelled(engine):
+    checks = []
+
+    def cancelled():
+        checks.append(None)
+        return len(checks) > 1
+
+    def progress(done, total):
+        raise AssertionError("the date should not finish")
+
+    with pytest.raises(SearchCancelled):
+        find_best_slots(ROSTER, 30, start_date=date(2026, 10, 19), engine=engine,
+                        progress=progress, cancelled=cancelled)
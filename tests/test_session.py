@@ -0,0 +1,80 @@
+import io
+import json
+import sys
+import threading
+from datetime import date, time
+
+from meet_zone.batch import run_serial
+from meet_zone.parser import Participant
+from meet_zone.session import MAX_REQUEST_DAYS, RosterSession
+
+START = date(2026, 10, 19)
+ROSTER = [
+    Participant("Alice", "UTC", time(6, 0), time(18, 0)),
+    Participant("Bob", "Europe/Berlin", time(9, 0), time(17, 0)),
+    Participant("Chen", "America/New_York", time(8, 0), time(16, 0)),
+    Participant("Dev", "Asia/Kolkata", time(9, 0), time(18, 0)),
+]
+REQUESTS = [
+    {"date": "2026-10-19", "week": True, "top": 5, "duration": 30, "prioritize": prioritize}
+    for prioritize in ("participants", "duration")
+]
+
+
+def expected_replies():
+    return [RosterSession(ROSTER, start_date=START).answer(request) for request in REQUESTS]
+
+
+def test_prioritize_modes_share_cached_candidates():
+    expected = expected_replies()
+    assert expected[0] != expected[1]
+
+    session = RosterSession(ROSTER, start_date=START)
+    for _ in range(3):
+        assert [session.answer(request) for request in REQUESTS] == expected
+
+
+def test_concurrent_prioritize_modes():
+    expected = expected_replies()
+    session = RosterSession(ROSTER, start_date=START)
+    wrong = []
+
+    def run(k):
+        for _ in range(30):
+            reply = session.answer(REQUESTS[k % 2])
+            if reply != expected[k % 2]:
+                wrong.append(reply)
+
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    try:
+        threads = [threading.Thread(target=run, args=(k,)) for k in range(6)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    finally:
+        sys.setswitchinterval(interval)
+    assert not wrong
+
+
+def test_out_of_range_date_is_a_request_error():
+    session = RosterSession(ROSTER, start_date=START)
+    reply = session.answer(json.loads('{"date":"9999-12-31","week":true}'))
+    assert "error" in reply and "slots" not in reply
+
+
+def test_days_must_be_in_range():
+    session = RosterSession(ROSTER, start_date=START)
+    for days in (0, -1, MAX_REQUEST_DAYS + 1):
+        assert "error" in session.answer({"date": "2026-10-19", "days": days})
+    assert "slots" in session.answer({"date": "2026-10-19", "days": 2})
+
+
+def test_batch_continues_after_out_of_range_date():
+    session = RosterSession(ROSTER, start_date=START)
+    output = io.StringIO()
+    errors = run_serial(session, io.StringIO('{"date":"9999-12-31","week":true}\n{"date":"2026-10-19"}\n'), output)
+    replies = [json.loads(line) for line in output.getvalue().splitlines()]
+    assert errors == 1
+    assert "error" in replies[0] and "slots" in replies[1]